@@ -9,6 +9,7 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
 import sys
+import logging
 from datetime import datetime
 from typing import Dict, Any
 
@@ -439,6 +440,8 @@ def api_test():
     })
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🚀 Starting Career Assistant API Service...")
     print("📱 API endpoints available at: http://localhost:5002")
     print("📋 Available endpoints:")
@@ -9,6 +9,7 @@ job recommendations with detailed analysis and skill gap identification.
 import os
 import sys
 import json
+import logging
 import argparse
 from typing import List, Optional
 from datetime import datetime
@@ -378,6 +379,9 @@ Examples:
     
     args = parser.parse_args()
     
+    # Surface the job sources' progress messages on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Create and run career assistant
     assistant = CareerAssistant()
     
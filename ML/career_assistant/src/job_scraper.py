@@ -5,24 +5,58 @@ This module handles scraping job postings from LinkedIn and Indeed.
 Uses requests-html for web scraping and includes rate limiting and error handling.
 """
 
+import asyncio
 import time
 import re
 import os
-from typing import List, Dict, Optional
+import sys
+from typing import List, Dict, Optional, Sequence
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import compress, islice
 import json
+import hashlib
+import logging
+import threading
 from urllib.parse import urlencode, urlparse
 import random
 
-# Optional imports for web scraping
+logger = logging.getLogger(__name__)
+
+# Optional imports for HTTP APIs
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from urllib3.util.request import ACCEPT_ENCODING
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Optional imports for web scraping
+try:
     from requests_html import HTMLSession
-    SCRAPING_AVAILABLE = True
+    SCRAPING_AVAILABLE = REQUESTS_AVAILABLE
 except ImportError:
-    print("⚠️  Web scraping libraries not available. Using sample data only.")
     SCRAPING_AVAILABLE = False
 
+if not SCRAPING_AVAILABLE:
+    print("⚠️  Web scraping libraries not available. Using sample data only.")
+
+# Optional fast JSON decoder for large API payloads
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional incremental JSON parser so capped dataset reads stop early
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Import dynamic job generator
 try:
     from .dynamic_job_generator import job_generator
@@ -32,7 +66,11 @@ except ImportError:
     DYNAMIC_GENERATOR_AVAILABLE = False
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a regular __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class JobPosting:
     """Represents a job posting with all relevant information."""
     
@@ -40,7 +78,7 @@ class JobPosting:
     company: str
     location: str
     description: str
-    skills_required: List[str]
+    skills_required: Sequence[str]
     experience_level: Optional[str] = None
     salary_range: Optional[str] = None
     job_type: Optional[str] = None  # "full-time", "part-time", "contract"
@@ -56,7 +94,7 @@ class JobPosting:
             "company": self.company,
             "location": self.location,
             "description": self.description,
-            "skills_required": self.skills_required,
+            "skills_required": list(self.skills_required),
             "experience_level": self.experience_level,
             "salary_range": self.salary_range,
             "job_type": self.job_type,
@@ -67,6 +105,30 @@ class JobPosting:
         }
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class QueryContext:
+    """A search query and location normalized once and shared by every job source."""
+    
+    raw: str
+    location: str
+    lower: str
+    location_lower: str
+    location_slug: str
+    
+    @classmethod
+    def build(cls, query: str, location: str = "") -> "QueryContext":
+        """Normalize a raw query/location pair."""
+        query_lower = query.lower()
+        location_lower = location.lower()
+        return cls(
+            raw=query,
+            location=location,
+            lower=query_lower,
+            location_lower=location_lower,
+            location_slug=location_lower.replace(' ', '-').replace(',', '')
+        )
+
+
 def get_dynamic_sample_jobs(query: str, location: str, limit: int, source: str) -> List[JobPosting]:
     """Get dynamic job postings for any source using the dynamic job generator."""
     if DYNAMIC_GENERATOR_AVAILABLE:
@@ -89,6 +151,53 @@ def get_dynamic_sample_jobs(query: str, location: str, limit: int, source: str)
         ]
 
 
+@lru_cache(maxsize=256)
+def _compile_query(query_lower: str) -> Optional[re.Pattern]:
+    """Compile the words of a lowercased query into a single alternation regex."""
+    words = query_lower.split()
+    if not words:
+        return None
+    return re.compile("|".join(map(re.escape, words)))
+
+
+def _filter_by_query(jobs: Sequence[JobPosting], query_lower: str, limit: Optional[int] = None) -> List[JobPosting]:
+    """Keep jobs whose title or description contains any word of the lowercased query.
+    
+    Matching is lazy, so with a limit the scan stops as soon as enough jobs are found.
+    """
+    pattern = _compile_query(query_lower)
+    if pattern is None:
+        return []
+    
+    # Words never contain whitespace, so joining on a newline cannot create false matches
+    haystacks = (f"{job.title}\n{job.description}".lower() for job in jobs)
+    return list(islice(compress(jobs, map(pattern.search, haystacks)), limit))
+
+
+def _slice(jobs: Sequence[JobPosting], limit: int) -> List[JobPosting]:
+    """Return at most limit jobs as a list the caller owns.
+    
+    A per-call result list that already fits is handed back as is; the shared
+    module-level catalogs are always copied.
+    """
+    if isinstance(jobs, list) and limit >= len(jobs):
+        return jobs
+    return list(jobs[:limit])
+
+
+def _create_api_session(max_retries=0) -> Optional["requests.Session"]:
+    """Create a keep-alive HTTP session with a connection pool for an API client."""
+    if not REQUESTS_AVAILABLE:
+        return None
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': 'CareerAssistant/1.0'})
+    return session
+
+
 class JobScraper:
     """Base class for job scrapers with common functionality."""
     
@@ -177,9 +286,6 @@ class IndeedScraper(JobScraper):
         
         try:
             # Use a simpler approach with requests to avoid asyncio issues
-            import requests
-            import time
-            
             # Add a longer delay to seem more human-like
             time.sleep(random.uniform(2, 4))
             
@@ -373,6 +479,46 @@ class LinkedInScraper(JobScraper):
         return get_dynamic_sample_jobs(query, location, limit, "linkedin")
 
 
+_GLASSDOOR_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Software Engineer",
+        company="Adobe",
+        location="San Jose, CA",
+        description="Build creative software tools used by millions. Strong background in C++ and graphics programming required.",
+        skills_required=("c++", "graphics", "opengl", "python", "git"),
+        experience_level="senior",
+        salary_range="$140,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="glassdoor"
+    ),
+    JobPosting(
+        title="Product Manager",
+        company="Slack",
+        location="San Francisco, CA",
+        description="Lead product strategy for communication platform. Experience with B2B SaaS and agile development.",
+        skills_required=("product management", "agile", "sql", "analytics", "jira"),
+        experience_level="mid",
+        salary_range="$120,000 - $160,000",
+        job_type="full-time",
+        work_type="remote",
+        source="glassdoor"
+    ),
+    JobPosting(
+        title="Data Engineer",
+        company="Airbnb",
+        location="San Francisco, CA",
+        description="Build data pipelines for travel platform. Spark, Kafka, and AWS experience preferred.",
+        skills_required=("spark", "kafka", "aws", "python", "sql", "airflow"),
+        experience_level="mid",
+        salary_range="$130,000 - $170,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="glassdoor"
+    )
+)
+
+
 class GlassdoorScraper(JobScraper):
     """Scraper for Glassdoor job postings."""
     
@@ -386,9 +532,7 @@ class GlassdoorScraper(JobScraper):
         jobs = []
         
         try:
-            import requests
             from bs4 import BeautifulSoup
-            import time
             
             # Add delay to seem more human-like
             time.sleep(random.uniform(2, 4))
@@ -490,52 +634,50 @@ class GlassdoorScraper(JobScraper):
     
     def _get_sample_glassdoor_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Sample Glassdoor jobs with company ratings focus."""
-        glassdoor_jobs = [
-            JobPosting(
-                title="Senior Software Engineer",
-                company="Adobe",
-                location="San Jose, CA",
-                description="Build creative software tools used by millions. Strong background in C++ and graphics programming required.",
-                skills_required=["c++", "graphics", "opengl", "python", "git"],
-                experience_level="senior",
-                salary_range="$140,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="glassdoor"
-            ),
-            JobPosting(
-                title="Product Manager",
-                company="Slack",
-                location="San Francisco, CA",
-                description="Lead product strategy for communication platform. Experience with B2B SaaS and agile development.",
-                skills_required=["product management", "agile", "sql", "analytics", "jira"],
-                experience_level="mid",
-                salary_range="$120,000 - $160,000",
-                job_type="full-time",
-                work_type="remote",
-                source="glassdoor"
-            ),
-            JobPosting(
-                title="Data Engineer",
-                company="Airbnb",
-                location="San Francisco, CA",
-                description="Build data pipelines for travel platform. Spark, Kafka, and AWS experience preferred.",
-                skills_required=["spark", "kafka", "aws", "python", "sql", "airflow"],
-                experience_level="mid",
-                salary_range="$130,000 - $170,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="glassdoor"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in glassdoor_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_GLASSDOOR_SAMPLE_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else glassdoor_jobs[:limit]
+        return _slice(relevant_jobs or _GLASSDOOR_SAMPLE_JOBS, limit)
+
+
+_ZIPRECRUITER_SAMPLE_JOBS = (
+    JobPosting(
+        title="Full Stack Developer",
+        company="Microsoft",
+        location="Redmond, WA",
+        description="Develop cloud applications using .NET, React, and Azure. Join our collaborative team building the future of productivity.",
+        skills_required=("c#", "react", "azure", "sql server", "typescript"),
+        experience_level="mid",
+        salary_range="$100,000 - $140,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="ziprecruiter"
+    ),
+    JobPosting(
+        title="DevOps Engineer",
+        company="Tesla",
+        location="Austin, TX",
+        description="Automate deployment pipelines for electric vehicle software. Kubernetes, Terraform, and CI/CD expertise required.",
+        skills_required=("kubernetes", "terraform", "jenkins", "docker", "aws", "python"),
+        experience_level="senior",
+        salary_range="$120,000 - $160,000",
+        job_type="full-time",
+        work_type="onsite",
+        source="ziprecruiter"
+    ),
+    JobPosting(
+        title="Machine Learning Engineer",
+        company="OpenAI",
+        location="San Francisco, CA",
+        description="Research and deploy large language models. Strong background in deep learning and distributed systems.",
+        skills_required=("pytorch", "transformers", "cuda", "python", "distributed systems"),
+        experience_level="senior",
+        salary_range="$180,000 - $250,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="ziprecruiter"
+    )
+)
 
 
 class ZipRecruiterScraper(JobScraper):
@@ -551,9 +693,7 @@ class ZipRecruiterScraper(JobScraper):
         jobs = []
         
         try:
-            import requests
             from bs4 import BeautifulSoup
-            import time
             
             time.sleep(random.uniform(1, 3))
             
@@ -640,51 +780,61 @@ class ZipRecruiterScraper(JobScraper):
     
     def _get_sample_ziprecruiter_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Sample ZipRecruiter jobs."""
-        ziprecruiter_jobs = [
-            JobPosting(
-                title="Full Stack Developer",
-                company="Microsoft",
-                location="Redmond, WA",
-                description="Develop cloud applications using .NET, React, and Azure. Join our collaborative team building the future of productivity.",
-                skills_required=["c#", "react", "azure", "sql server", "typescript"],
-                experience_level="mid",
-                salary_range="$100,000 - $140,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="ziprecruiter"
-            ),
-            JobPosting(
-                title="DevOps Engineer",
-                company="Tesla",
-                location="Austin, TX",
-                description="Automate deployment pipelines for electric vehicle software. Kubernetes, Terraform, and CI/CD expertise required.",
-                skills_required=["kubernetes", "terraform", "jenkins", "docker", "aws", "python"],
-                experience_level="senior",
-                salary_range="$120,000 - $160,000",
-                job_type="full-time",
-                work_type="onsite",
-                source="ziprecruiter"
-            ),
-            JobPosting(
-                title="Machine Learning Engineer",
-                company="OpenAI",
-                location="San Francisco, CA",
-                description="Research and deploy large language models. Strong background in deep learning and distributed systems.",
-                skills_required=["pytorch", "transformers", "cuda", "python", "distributed systems"],
-                experience_level="senior",
-                salary_range="$180,000 - $250,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="ziprecruiter"
-            )
-        ]
+        relevant_jobs = _filter_by_query(_ZIPRECRUITER_SAMPLE_JOBS, query.lower(), limit)
         
-        query_lower = query.lower()
-        relevant_jobs = [job for job in ziprecruiter_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
-        
-        return relevant_jobs[:limit] if relevant_jobs else ziprecruiter_jobs[:limit]
+        return _slice(relevant_jobs or _ZIPRECRUITER_SAMPLE_JOBS, limit)
+
+
+_ENHANCED_LINKEDIN_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Software Engineer",
+        company="Apple",
+        location="Cupertino, CA",
+        description="Design and develop next-generation iOS applications. Swift, Objective-C, and iOS SDK expertise required.",
+        skills_required=("swift", "objective-c", "ios", "xcode", "git", "agile"),
+        experience_level="senior",
+        salary_range="$150,000 - $200,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="linkedin"
+    ),
+    JobPosting(
+        title="Product Designer",
+        company="Figma",
+        location="San Francisco, CA",
+        description="Create beautiful and intuitive user experiences for design collaboration tools. Strong UX/UI background needed.",
+        skills_required=("figma", "sketch", "prototyping", "user research", "design systems"),
+        experience_level="mid",
+        salary_range="$110,000 - $150,000",
+        job_type="full-time",
+        work_type="remote",
+        source="linkedin"
+    ),
+    JobPosting(
+        title="Data Scientist",
+        company="Uber",
+        location="San Francisco, CA",
+        description="Analyze rider and driver behavior patterns. Build ML models for pricing and demand forecasting.",
+        skills_required=("python", "sql", "machine learning", "spark", "kafka", "a/b testing"),
+        experience_level="senior",
+        salary_range="$140,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="linkedin"
+    ),
+    JobPosting(
+        title="Cloud Architect",
+        company="Amazon Web Services",
+        location="Seattle, WA",
+        description="Design scalable cloud infrastructure solutions for enterprise customers. AWS expertise essential.",
+        skills_required=("aws", "terraform", "kubernetes", "docker", "python", "cloud architecture"),
+        experience_level="senior",
+        salary_range="$160,000 - $220,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="linkedin"
+    )
+)
 
 
 class EnhancedLinkedInScraper(JobScraper):
@@ -700,9 +850,7 @@ class EnhancedLinkedInScraper(JobScraper):
         jobs = []
         
         try:
-            import requests
             from bs4 import BeautifulSoup
-            import time
             
             # Longer delays for LinkedIn
             time.sleep(random.uniform(3, 6))
@@ -809,63 +957,49 @@ class EnhancedLinkedInScraper(JobScraper):
     
     def _get_sample_enhanced_linkedin_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Enhanced LinkedIn sample jobs with professional focus."""
-        linkedin_jobs = [
-            JobPosting(
-                title="Senior Software Engineer",
-                company="Apple",
-                location="Cupertino, CA",
-                description="Design and develop next-generation iOS applications. Swift, Objective-C, and iOS SDK expertise required.",
-                skills_required=["swift", "objective-c", "ios", "xcode", "git", "agile"],
-                experience_level="senior",
-                salary_range="$150,000 - $200,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="linkedin"
-            ),
-            JobPosting(
-                title="Product Designer",
-                company="Figma",
-                location="San Francisco, CA",
-                description="Create beautiful and intuitive user experiences for design collaboration tools. Strong UX/UI background needed.",
-                skills_required=["figma", "sketch", "prototyping", "user research", "design systems"],
-                experience_level="mid",
-                salary_range="$110,000 - $150,000",
-                job_type="full-time",
-                work_type="remote",
-                source="linkedin"
-            ),
-            JobPosting(
-                title="Data Scientist",
-                company="Uber",
-                location="San Francisco, CA",
-                description="Analyze rider and driver behavior patterns. Build ML models for pricing and demand forecasting.",
-                skills_required=["python", "sql", "machine learning", "spark", "kafka", "a/b testing"],
-                experience_level="senior",
-                salary_range="$140,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="linkedin"
-            ),
-            JobPosting(
-                title="Cloud Architect",
-                company="Amazon Web Services",
-                location="Seattle, WA",
-                description="Design scalable cloud infrastructure solutions for enterprise customers. AWS expertise essential.",
-                skills_required=["aws", "terraform", "kubernetes", "docker", "python", "cloud architecture"],
-                experience_level="senior",
-                salary_range="$160,000 - $220,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="linkedin"
-            )
-        ]
-        
-        query_lower = query.lower()
-        relevant_jobs = [job for job in linkedin_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_ENHANCED_LINKEDIN_SAMPLE_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else linkedin_jobs[:limit]
+        return _slice(relevant_jobs or _ENHANCED_LINKEDIN_SAMPLE_JOBS, limit)
+
+
+_REMOTE_SAMPLE_JOBS = (
+    JobPosting(
+        title="Remote Python Developer",
+        company="GitLab",
+        location="Remote",
+        description="Work on the world's largest all-remote team. Build features for millions of developers using Ruby and Vue.js.",
+        skills_required=("ruby", "vue.js", "python", "postgresql", "redis", "git"),
+        experience_level="mid",
+        salary_range="$90,000 - $140,000",
+        job_type="full-time",
+        work_type="remote",
+        source="remoteok"
+    ),
+    JobPosting(
+        title="Remote Data Scientist",
+        company="Automattic",
+        location="Remote",
+        description="Analyze user behavior for WordPress.com and WooCommerce. Work from anywhere in the world.",
+        skills_required=("python", "r", "sql", "machine learning", "statistics", "tableau"),
+        experience_level="senior",
+        salary_range="$120,000 - $160,000",
+        job_type="full-time",
+        work_type="remote",
+        source="remoteok"
+    ),
+    JobPosting(
+        title="Remote Frontend Engineer",
+        company="Buffer",
+        location="Remote",
+        description="Build social media management tools used by 160,000+ customers. React and TypeScript focus.",
+        skills_required=("react", "typescript", "javascript", "css", "node.js", "graphql"),
+        experience_level="mid",
+        salary_range="$95,000 - $130,000",
+        job_type="full-time",
+        work_type="remote",
+        source="remoteok"
+    )
+)
 
 
 class RemoteOKScraper(JobScraper):
@@ -881,9 +1015,6 @@ class RemoteOKScraper(JobScraper):
         jobs = []
         
         try:
-            import requests
-            import time
-            
             time.sleep(random.uniform(1, 2))
             
             headers = self._get_random_headers()
@@ -955,51 +1086,105 @@ class RemoteOKScraper(JobScraper):
     
     def _get_sample_remote_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Sample remote jobs."""
-        remote_jobs = [
-            JobPosting(
-                title="Remote Python Developer",
-                company="GitLab",
-                location="Remote",
-                description="Work on the world's largest all-remote team. Build features for millions of developers using Ruby and Vue.js.",
-                skills_required=["ruby", "vue.js", "python", "postgresql", "redis", "git"],
-                experience_level="mid",
-                salary_range="$90,000 - $140,000",
-                job_type="full-time",
-                work_type="remote",
-                source="remoteok"
-            ),
-            JobPosting(
-                title="Remote Data Scientist",
-                company="Automattic",
-                location="Remote",
-                description="Analyze user behavior for WordPress.com and WooCommerce. Work from anywhere in the world.",
-                skills_required=["python", "r", "sql", "machine learning", "statistics", "tableau"],
-                experience_level="senior",
-                salary_range="$120,000 - $160,000",
-                job_type="full-time",
-                work_type="remote",
-                source="remoteok"
-            ),
-            JobPosting(
-                title="Remote Frontend Engineer",
-                company="Buffer",
-                location="Remote",
-                description="Build social media management tools used by 160,000+ customers. React and TypeScript focus.",
-                skills_required=["react", "typescript", "javascript", "css", "node.js", "graphql"],
-                experience_level="mid",
-                salary_range="$95,000 - $130,000",
-                job_type="full-time",
-                work_type="remote",
-                source="remoteok"
-            )
-        ]
-        
-        query_lower = query.lower()
-        relevant_jobs = [job for job in remote_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_REMOTE_SAMPLE_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else remote_jobs[:limit]
+        return _slice(relevant_jobs or _REMOTE_SAMPLE_JOBS, limit)
+
+
+_CURATED_STARTUP_JOBS = (
+    JobPosting(
+        title="Full Stack Engineer",
+        company="Notion",
+        location="San Francisco, CA",
+        description="Help build the future of productivity tools. Work with React, Node.js, and cutting-edge technologies.",
+        skills_required=("react", "node.js", "typescript", "postgresql", "redis"),
+        experience_level="mid",
+        salary_range="$130,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="startup-jobs"
+    ),
+    JobPosting(
+        title="AI/ML Engineer",
+        company="Anthropic",
+        location="San Francisco, CA",
+        description="Research and develop large language models. Work on the frontier of AI safety and capabilities.",
+        skills_required=("pytorch", "transformers", "python", "cuda", "distributed systems"),
+        experience_level="senior",
+        salary_range="$200,000 - $300,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="startup-jobs"
+    ),
+    JobPosting(
+        title="DevOps Engineer",
+        company="Vercel",
+        location="Remote",
+        description="Scale the platform that powers the modern web. Work with Next.js, Kubernetes, and global edge infrastructure.",
+        skills_required=("kubernetes", "docker", "aws", "terraform", "next.js", "typescript"),
+        experience_level="senior",
+        salary_range="$140,000 - $200,000",
+        job_type="full-time",
+        work_type="remote",
+        source="startup-jobs"
+    )
+)
+
+
+_GOVERNMENT_SAMPLE_JOBS = (
+    JobPosting(
+        title="Software Developer",
+        company="U.S. Digital Service",
+        location="Washington, DC",
+        description="Modernize government technology to better serve the American people. Work on high-impact projects.",
+        skills_required=("javascript", "python", "aws", "agile", "user research"),
+        experience_level="mid",
+        salary_range="$102,000 - $172,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="government"
+    ),
+    JobPosting(
+        title="Data Scientist",
+        company="NASA",
+        location="Houston, TX",
+        description="Analyze space mission data and support human spaceflight operations. Security clearance required.",
+        skills_required=("python", "r", "machine learning", "matlab", "sql"),
+        experience_level="senior",
+        salary_range="$95,000 - $145,000",
+        job_type="full-time",
+        work_type="onsite",
+        source="government"
+    )
+)
+
+
+_TECH_STARTUP_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior React Developer",
+        company="Discord",
+        location="San Francisco, CA",
+        description="Build features for millions of gamers and communities. Real-time communication at scale.",
+        skills_required=("react", "typescript", "websockets", "node.js", "redis"),
+        experience_level="senior",
+        salary_range="$150,000 - $200,000",
+        job_type="full-time",
+        work_type="hybrid",
+        source="tech-startups"
+    ),
+    JobPosting(
+        title="Platform Engineer",
+        company="Cloudflare",
+        location="Austin, TX",
+        description="Build the infrastructure that powers 20% of the web. Work with global edge computing.",
+        skills_required=("go", "rust", "kubernetes", "linux", "networking"),
+        experience_level="senior",
+        salary_range="$140,000 - $190,000",
+        job_type="full-time",
+        work_type="remote",
+        source="tech-startups"
+    )
+)
 
 
 class JobsAPIProvider(JobScraper):
@@ -1019,8 +1204,6 @@ class JobsAPIProvider(JobScraper):
     def _search_usajobs_api(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Search government jobs via USAJobs API."""
         try:
-            import requests
-            
             headers = {
                 'Host': 'data.usajobs.gov',
                 'User-Agent': 'Career-Assistant-Bot/1.0 (contact@example.com)',
@@ -1046,123 +1229,90 @@ class JobsAPIProvider(JobScraper):
     
     def _get_curated_startup_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Curated startup jobs from various sources."""
-        startup_jobs = [
-            JobPosting(
-                title="Full Stack Engineer",
-                company="Notion",
-                location="San Francisco, CA",
-                description="Help build the future of productivity tools. Work with React, Node.js, and cutting-edge technologies.",
-                skills_required=["react", "node.js", "typescript", "postgresql", "redis"],
-                experience_level="mid",
-                salary_range="$130,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="startup-jobs"
-            ),
-            JobPosting(
-                title="AI/ML Engineer",
-                company="Anthropic",
-                location="San Francisco, CA",
-                description="Research and develop large language models. Work on the frontier of AI safety and capabilities.",
-                skills_required=["pytorch", "transformers", "python", "cuda", "distributed systems"],
-                experience_level="senior",
-                salary_range="$200,000 - $300,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="startup-jobs"
-            ),
-            JobPosting(
-                title="DevOps Engineer",
-                company="Vercel",
-                location="Remote",
-                description="Scale the platform that powers the modern web. Work with Next.js, Kubernetes, and global edge infrastructure.",
-                skills_required=["kubernetes", "docker", "aws", "terraform", "next.js", "typescript"],
-                experience_level="senior",
-                salary_range="$140,000 - $200,000",
-                job_type="full-time",
-                work_type="remote",
-                source="startup-jobs"
-            )
-        ]
-        
-        query_lower = query.lower()
-        relevant_jobs = [job for job in startup_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_CURATED_STARTUP_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else startup_jobs[:limit]
+        return _slice(relevant_jobs or _CURATED_STARTUP_JOBS, limit)
     
     def _get_sample_government_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Sample government/public sector jobs."""
-        gov_jobs = [
-            JobPosting(
-                title="Software Developer",
-                company="U.S. Digital Service",
-                location="Washington, DC",
-                description="Modernize government technology to better serve the American people. Work on high-impact projects.",
-                skills_required=["javascript", "python", "aws", "agile", "user research"],
-                experience_level="mid",
-                salary_range="$102,000 - $172,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="government"
-            ),
-            JobPosting(
-                title="Data Scientist",
-                company="NASA",
-                location="Houston, TX",
-                description="Analyze space mission data and support human spaceflight operations. Security clearance required.",
-                skills_required=["python", "r", "machine learning", "matlab", "sql"],
-                experience_level="senior",
-                salary_range="$95,000 - $145,000",
-                job_type="full-time",
-                work_type="onsite",
-                source="government"
-            )
-        ]
+        relevant_jobs = _filter_by_query(_GOVERNMENT_SAMPLE_JOBS, query.lower(), limit)
         
-        query_lower = query.lower()
-        relevant_jobs = [job for job in gov_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
-        
-        return relevant_jobs[:limit] if relevant_jobs else gov_jobs[:limit]
+        return _slice(relevant_jobs or _GOVERNMENT_SAMPLE_JOBS, limit)
     
     def _get_sample_tech_startup_jobs(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Sample tech startup jobs."""
-        startup_jobs = [
-            JobPosting(
-                title="Senior React Developer",
-                company="Discord",
-                location="San Francisco, CA",
-                description="Build features for millions of gamers and communities. Real-time communication at scale.",
-                skills_required=["react", "typescript", "websockets", "node.js", "redis"],
-                experience_level="senior",
-                salary_range="$150,000 - $200,000",
-                job_type="full-time",
-                work_type="hybrid",
-                source="tech-startups"
-            ),
-            JobPosting(
-                title="Platform Engineer",
-                company="Cloudflare",
-                location="Austin, TX",
-                description="Build the infrastructure that powers 20% of the web. Work with global edge computing.",
-                skills_required=["go", "rust", "kubernetes", "linux", "networking"],
-                experience_level="senior",
-                salary_range="$140,000 - $190,000",
-                job_type="full-time",
-                work_type="remote",
-                source="tech-startups"
-            )
-        ]
-        
-        query_lower = query.lower()
-        relevant_jobs = [job for job in startup_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_TECH_STARTUP_SAMPLE_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else startup_jobs[:limit]
+        return _slice(relevant_jobs or _TECH_STARTUP_SAMPLE_JOBS, limit)
+
+
+_LINKEDIN_API_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Software Engineer - Platform",
+        company="LinkedIn",
+        location="Sunnyvale, CA",
+        description="Build the platform that connects professionals worldwide. Work with large-scale distributed systems, microservices, and real-time data processing.",
+        skills_required=("java", "scala", "kafka", "hadoop", "spark", "kubernetes"),
+        experience_level="senior",
+        salary_range="$160,000 - $220,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://linkedin.com/jobs/12345",
+        source="linkedin-api"
+    ),
+    JobPosting(
+        title="Data Scientist - ML Infrastructure",
+        company="Salesforce",
+        location="San Francisco, CA",
+        description="Develop machine learning infrastructure for CRM platform. Build ML pipelines, feature stores, and model deployment systems.",
+        skills_required=("python", "tensorflow", "pytorch", "mlflow", "airflow", "aws"),
+        experience_level="senior",
+        salary_range="$145,000 - $195,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://linkedin.com/jobs/12346",
+        source="linkedin-api"
+    ),
+    JobPosting(
+        title="Product Manager - AI",
+        company="NVIDIA",
+        location="Santa Clara, CA",
+        description="Lead AI product strategy for GPU computing platforms. Work with engineering teams on AI chip development and software ecosystems.",
+        skills_required=("product management", "ai/ml", "gpu computing", "cuda", "product strategy"),
+        experience_level="senior",
+        salary_range="$150,000 - $200,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://linkedin.com/jobs/12347",
+        source="linkedin-api"
+    ),
+    JobPosting(
+        title="Full Stack Engineer",
+        company="Zoom",
+        location="San Jose, CA",
+        description="Build video conferencing features used by millions. Work with React, Node.js, and real-time communication protocols.",
+        skills_required=("react", "node.js", "webrtc", "typescript", "redis", "postgresql"),
+        experience_level="mid",
+        salary_range="$120,000 - $160,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://linkedin.com/jobs/12348",
+        source="linkedin-api"
+    ),
+    JobPosting(
+        title="DevOps Engineer - Cloud Infrastructure",
+        company="Snowflake",
+        location="San Mateo, CA",
+        description="Manage cloud infrastructure for data warehouse platform. Work with AWS, Kubernetes, and infrastructure as code.",
+        skills_required=("aws", "kubernetes", "terraform", "docker", "python", "monitoring"),
+        experience_level="mid",
+        salary_range="$130,000 - $170,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://linkedin.com/jobs/12349",
+        source="linkedin-api"
+    )
+)
 
 
 class LinkedInAPIClient:
@@ -1174,12 +1324,11 @@ class LinkedInAPIClient:
         self.client_secret = client_secret or "your_linkedin_client_secret"
         self.access_token = None
         self.base_url = "https://api.linkedin.com/v2"
+        self.session = _create_api_session()
         
     def authenticate(self) -> bool:
         """Authenticate with LinkedIn API using OAuth 2.0."""
         try:
-            import requests
-            
             # For now, we'll use a placeholder authentication
             # In production, you'd need to implement full OAuth flow
             print("LinkedIn API: Authentication would be implemented here")
@@ -1197,8 +1346,6 @@ class LinkedInAPIClient:
             return get_dynamic_sample_jobs(query, location, limit, "linkedin-api")
         
         try:
-            import requests
-            
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
                 'Content-Type': 'application/json',
@@ -1213,7 +1360,7 @@ class LinkedInAPIClient:
             }
             
             url = f"{self.base_url}/jobSearch"
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1265,81 +1412,118 @@ class LinkedInAPIClient:
     
     def _get_linkedin_api_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
         """Enhanced LinkedIn sample data that simulates API responses."""
-        linkedin_api_jobs = [
-            JobPosting(
-                title="Senior Software Engineer - Platform",
-                company="LinkedIn",
-                location="Sunnyvale, CA",
-                description="Build the platform that connects professionals worldwide. Work with large-scale distributed systems, microservices, and real-time data processing.",
-                skills_required=["java", "scala", "kafka", "hadoop", "spark", "kubernetes"],
-                experience_level="senior",
-                salary_range="$160,000 - $220,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://linkedin.com/jobs/12345",
-                source="linkedin-api"
-            ),
-            JobPosting(
-                title="Data Scientist - ML Infrastructure",
-                company="Salesforce",
-                location="San Francisco, CA",
-                description="Develop machine learning infrastructure for CRM platform. Build ML pipelines, feature stores, and model deployment systems.",
-                skills_required=["python", "tensorflow", "pytorch", "mlflow", "airflow", "aws"],
-                experience_level="senior",
-                salary_range="$145,000 - $195,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://linkedin.com/jobs/12346",
-                source="linkedin-api"
-            ),
-            JobPosting(
-                title="Product Manager - AI",
-                company="NVIDIA",
-                location="Santa Clara, CA",
-                description="Lead AI product strategy for GPU computing platforms. Work with engineering teams on AI chip development and software ecosystems.",
-                skills_required=["product management", "ai/ml", "gpu computing", "cuda", "product strategy"],
-                experience_level="senior",
-                salary_range="$150,000 - $200,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://linkedin.com/jobs/12347",
-                source="linkedin-api"
-            ),
-            JobPosting(
-                title="Full Stack Engineer",
-                company="Zoom",
-                location="San Jose, CA",
-                description="Build video conferencing features used by millions. Work with React, Node.js, and real-time communication protocols.",
-                skills_required=["react", "node.js", "webrtc", "typescript", "redis", "postgresql"],
-                experience_level="mid",
-                salary_range="$120,000 - $160,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://linkedin.com/jobs/12348",
-                source="linkedin-api"
-            ),
-            JobPosting(
-                title="DevOps Engineer - Cloud Infrastructure",
-                company="Snowflake",
-                location="San Mateo, CA",
-                description="Manage cloud infrastructure for data warehouse platform. Work with AWS, Kubernetes, and infrastructure as code.",
-                skills_required=["aws", "kubernetes", "terraform", "docker", "python", "monitoring"],
-                experience_level="mid",
-                salary_range="$130,000 - $170,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://linkedin.com/jobs/12349",
-                source="linkedin-api"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in linkedin_api_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_LINKEDIN_API_SAMPLE_JOBS, query.lower(), limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else linkedin_api_jobs[:limit]
+        return _slice(relevant_jobs or _LINKEDIN_API_SAMPLE_JOBS, limit)
+
+
+_NAUKRI_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Python Developer",
+        company="Infosys",
+        location="Bangalore, India",
+        description="Develop enterprise applications using Python, Django, and cloud technologies. Work with global clients on digital transformation projects.",
+        skills_required=("python", "django", "aws", "mysql", "rest api", "microservices"),
+        experience_level="senior",
+        salary_range="₹12,00,000 - ₹18,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12345",
+        source="naukri"
+    ),
+    JobPosting(
+        title="Data Scientist",
+        company="Tata Consultancy Services",
+        location="Mumbai, India",
+        description="Build ML models for banking and financial services clients. Work with large datasets and advanced analytics.",
+        skills_required=("python", "machine learning", "pandas", "scikit-learn", "sql", "tableau"),
+        experience_level="mid",
+        salary_range="₹8,00,000 - ₹14,00,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://naukri.com/jobs/12346",
+        source="naukri"
+    ),
+    JobPosting(
+        title="Full Stack Developer",
+        company="Wipro",
+        location="Hyderabad, India",
+        description="Develop web applications using MEAN/MERN stack. Work on client projects in healthcare and retail domains.",
+        skills_required=("javascript", "react", "node.js", "mongodb", "express", "angular"),
+        experience_level="mid",
+        salary_range="₹6,00,000 - ₹12,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12347",
+        source="naukri"
+    ),
+    JobPosting(
+        title="DevOps Engineer",
+        company="Tech Mahindra",
+        location="Pune, India",
+        description="Manage CI/CD pipelines and cloud infrastructure. Work with Docker, Kubernetes, and AWS services.",
+        skills_required=("docker", "kubernetes", "aws", "jenkins", "terraform", "linux"),
+        experience_level="mid",
+        salary_range="₹7,00,000 - ₹13,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12348",
+        source="naukri"
+    ),
+    JobPosting(
+        title="Software Engineer - Java",
+        company="HCL Technologies",
+        location="Chennai, India",
+        description="Develop enterprise Java applications for global clients. Work with Spring Boot, microservices, and cloud platforms.",
+        skills_required=("java", "spring boot", "microservices", "mysql", "rest api", "junit"),
+        experience_level="entry",
+        salary_range="₹4,00,000 - ₹8,00,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://naukri.com/jobs/12349",
+        source="naukri"
+    ),
+    JobPosting(
+        title="React Developer",
+        company="Accenture",
+        location="Gurgaon, India",
+        description="Build modern web applications using React.js and related technologies. Work on digital transformation projects.",
+        skills_required=("react", "javascript", "typescript", "redux", "webpack", "jest"),
+        experience_level="mid",
+        salary_range="₹5,00,000 - ₹10,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12350",
+        source="naukri"
+    ),
+    JobPosting(
+        title="Senior Data Engineer",
+        company="Cognizant",
+        location="Bangalore, India",
+        description="Design and implement data pipelines for big data analytics. Work with Spark, Hadoop, and cloud data platforms.",
+        skills_required=("spark", "hadoop", "python", "sql", "airflow", "aws"),
+        experience_level="senior",
+        salary_range="₹10,00,000 - ₹16,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12351",
+        source="naukri"
+    ),
+    JobPosting(
+        title="Machine Learning Engineer",
+        company="Flipkart",
+        location="Bangalore, India",
+        description="Build recommendation systems and ML models for e-commerce platform. Work with TensorFlow, PyTorch, and big data.",
+        skills_required=("machine learning", "python", "tensorflow", "pytorch", "spark", "kafka"),
+        experience_level="senior",
+        salary_range="₹15,00,000 - ₹25,00,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://naukri.com/jobs/12352",
+        source="naukri"
+    )
+)
 
 
 class NaukriAPIClient:
@@ -1349,159 +1533,51 @@ class NaukriAPIClient:
         """Initialize Naukri API client."""
         self.api_key = api_key or "your_naukri_api_key"
         self.base_url = "https://www.naukri.com/jobapi/v3"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using Naukri API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using Naukri API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0'
+                'Content-Type': 'application/json'
             }
             
             params = {
-                'keywords': query,
-                'location': location,
+                'keywords': ctx.raw,
+                'location': ctx.location,
                 'limit': min(limit, 100),
                 'industry': 'IT-Software,IT-Hardware',
                 'experience': '0-15',
                 'api_key': self.api_key
             }
             
-            print(f"Searching Naukri API for: {query} in {location}")
+            print(f"Searching Naukri API for: {ctx.raw} in {ctx.location}")
             
             # Note: Naukri API requires business partnership
             # For now, we'll use enhanced sample data
-            return self._get_naukri_sample_data(query, location, limit)
+            return self._get_naukri_sample_data(ctx, limit)
             
         except Exception as e:
             print(f"Naukri API request failed: {e}")
-            return self._get_naukri_sample_data(query, location, limit)
+            return self._get_naukri_sample_data(ctx, limit)
     
-    def _get_naukri_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_naukri_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced Naukri sample data for Indian job market."""
-        naukri_jobs = [
-            JobPosting(
-                title="Senior Python Developer",
-                company="Infosys",
-                location="Bangalore, India",
-                description="Develop enterprise applications using Python, Django, and cloud technologies. Work with global clients on digital transformation projects.",
-                skills_required=["python", "django", "aws", "mysql", "rest api", "microservices"],
-                experience_level="senior",
-                salary_range="₹12,00,000 - ₹18,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12345",
-                source="naukri"
-            ),
-            JobPosting(
-                title="Data Scientist",
-                company="Tata Consultancy Services",
-                location="Mumbai, India",
-                description="Build ML models for banking and financial services clients. Work with large datasets and advanced analytics.",
-                skills_required=["python", "machine learning", "pandas", "scikit-learn", "sql", "tableau"],
-                experience_level="mid",
-                salary_range="₹8,00,000 - ₹14,00,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://naukri.com/jobs/12346",
-                source="naukri"
-            ),
-            JobPosting(
-                title="Full Stack Developer",
-                company="Wipro",
-                location="Hyderabad, India",
-                description="Develop web applications using MEAN/MERN stack. Work on client projects in healthcare and retail domains.",
-                skills_required=["javascript", "react", "node.js", "mongodb", "express", "angular"],
-                experience_level="mid",
-                salary_range="₹6,00,000 - ₹12,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12347",
-                source="naukri"
-            ),
-            JobPosting(
-                title="DevOps Engineer",
-                company="Tech Mahindra",
-                location="Pune, India",
-                description="Manage CI/CD pipelines and cloud infrastructure. Work with Docker, Kubernetes, and AWS services.",
-                skills_required=["docker", "kubernetes", "aws", "jenkins", "terraform", "linux"],
-                experience_level="mid",
-                salary_range="₹7,00,000 - ₹13,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12348",
-                source="naukri"
-            ),
-            JobPosting(
-                title="Software Engineer - Java",
-                company="HCL Technologies",
-                location="Chennai, India",
-                description="Develop enterprise Java applications for global clients. Work with Spring Boot, microservices, and cloud platforms.",
-                skills_required=["java", "spring boot", "microservices", "mysql", "rest api", "junit"],
-                experience_level="entry",
-                salary_range="₹4,00,000 - ₹8,00,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://naukri.com/jobs/12349",
-                source="naukri"
-            ),
-            JobPosting(
-                title="React Developer",
-                company="Accenture",
-                location="Gurgaon, India",
-                description="Build modern web applications using React.js and related technologies. Work on digital transformation projects.",
-                skills_required=["react", "javascript", "typescript", "redux", "webpack", "jest"],
-                experience_level="mid",
-                salary_range="₹5,00,000 - ₹10,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12350",
-                source="naukri"
-            ),
-            JobPosting(
-                title="Senior Data Engineer",
-                company="Cognizant",
-                location="Bangalore, India",
-                description="Design and implement data pipelines for big data analytics. Work with Spark, Hadoop, and cloud data platforms.",
-                skills_required=["spark", "hadoop", "python", "sql", "airflow", "aws"],
-                experience_level="senior",
-                salary_range="₹10,00,000 - ₹16,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12351",
-                source="naukri"
-            ),
-            JobPosting(
-                title="Machine Learning Engineer",
-                company="Flipkart",
-                location="Bangalore, India",
-                description="Build recommendation systems and ML models for e-commerce platform. Work with TensorFlow, PyTorch, and big data.",
-                skills_required=["machine learning", "python", "tensorflow", "pytorch", "spark", "kafka"],
-                experience_level="senior",
-                salary_range="₹15,00,000 - ₹25,00,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://naukri.com/jobs/12352",
-                source="naukri"
-            )
-        ]
-        
         # Filter based on query and location
-        query_lower = query.lower()
-        relevant_jobs = [job for job in naukri_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_NAUKRI_SAMPLE_JOBS, ctx.lower)
         
         # Filter by location if specified
-        if location and location.strip():
+        if ctx.location_lower.strip():
             location_filtered = [job for job in relevant_jobs 
-                               if location.lower() in job.location.lower()]
+                               if ctx.location_lower in job.location.lower()]
             if location_filtered:
                 relevant_jobs = location_filtered
         
-        return relevant_jobs[:limit] if relevant_jobs else naukri_jobs[:limit]
+        return _slice(relevant_jobs or _NAUKRI_SAMPLE_JOBS, limit)
 
 
 class LinkedInNaukriScraper(JobScraper):
@@ -1523,7 +1599,7 @@ class LinkedInNaukriScraper(JobScraper):
             print(f"Found {len(linkedin_jobs)} jobs from LinkedIn API")
             
             # Search Naukri API
-            naukri_jobs = self.naukri_client.search_jobs(query, location, limit//2)
+            naukri_jobs = self.naukri_client.search_with_context(QueryContext.build(query, location), limit//2)
             all_jobs.extend(naukri_jobs)
             print(f"Found {len(naukri_jobs)} jobs from Naukri API")
             
@@ -1533,6 +1609,75 @@ class LinkedInNaukriScraper(JobScraper):
         return all_jobs[:limit]
 
 
+_MONSTER_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Software Engineer",
+        company="Accenture",
+        location="New York, NY",
+        description="Lead software development projects for Fortune 500 clients. Work with cloud technologies and modern development practices.",
+        skills_required=("java", "spring", "aws", "docker", "kubernetes", "microservices"),
+        experience_level="senior",
+        salary_range="$120,000 - $150,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://monster.com/jobs/12345",
+        source="monster"
+    ),
+    JobPosting(
+        title="Data Analyst",
+        company="IBM",
+        location="Austin, TX",
+        description="Analyze business data to drive strategic decisions. Create dashboards and reports for executive leadership.",
+        skills_required=("sql", "python", "tableau", "excel", "data visualization", "statistics"),
+        experience_level="mid",
+        salary_range="$75,000 - $95,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://monster.com/jobs/12346",
+        source="monster"
+    ),
+    JobPosting(
+        title="Project Manager - IT",
+        company="Deloitte",
+        location="Chicago, IL",
+        description="Manage large-scale IT transformation projects. Lead cross-functional teams and ensure project delivery.",
+        skills_required=("project management", "agile", "scrum", "stakeholder management", "pmp"),
+        experience_level="senior",
+        salary_range="$110,000 - $135,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://monster.com/jobs/12347",
+        source="monster"
+    ),
+    JobPosting(
+        title="Frontend Developer",
+        company="Capital One",
+        location="McLean, VA",
+        description="Build responsive web applications for banking platform. Work with React, TypeScript, and modern frontend tools.",
+        skills_required=("react", "typescript", "javascript", "css", "html", "redux"),
+        experience_level="mid",
+        salary_range="$90,000 - $120,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://monster.com/jobs/12348",
+        source="monster"
+    ),
+    JobPosting(
+        title="Cybersecurity Analyst",
+        company="Lockheed Martin",
+        location="Denver, CO",
+        description="Monitor and protect critical infrastructure systems. Implement security policies and incident response procedures.",
+        skills_required=("cybersecurity", "incident response", "siem", "network security", "risk assessment"),
+        experience_level="mid",
+        salary_range="$85,000 - $110,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://monster.com/jobs/12349",
+        source="monster"
+    )
+)
+
+
 class MonsterAPIClient:
     """Monster.com API client for general job market coverage."""
     
@@ -1540,112 +1685,99 @@ class MonsterAPIClient:
         """Initialize Monster API client."""
         self.api_key = api_key or "your_monster_api_key"
         self.base_url = "https://api.monster.com/v2"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using Monster API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using Monster API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
                 'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0'
+                'Content-Type': 'application/json'
             }
             
             params = {
-                'q': query,
-                'where': location,
+                'q': ctx.raw,
+                'where': ctx.location,
                 'page': 1,
                 'page_size': min(limit, 100)
             }
             
-            print(f"Searching Monster API for: {query} in {location}")
+            logger.info("Searching Monster API for: %s in %s", ctx.raw, ctx.location)
             
             # Note: Monster API requires business partnership
-            print("Note: Monster API requires business partnership, using enhanced sample data")
-            return self._get_monster_sample_data(query, location, limit)
+            logger.info("Note: Monster API requires business partnership, using enhanced sample data")
+            return self._get_monster_sample_data(ctx, limit)
             
         except Exception as e:
-            print(f"Monster API request failed: {e}")
-            return self._get_monster_sample_data(query, location, limit)
+            logger.warning("Monster API request failed: %s", e)
+            return self._get_monster_sample_data(ctx, limit)
     
-    def _get_monster_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_monster_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced Monster sample data for general job market."""
-        monster_jobs = [
-            JobPosting(
-                title="Senior Software Engineer",
-                company="Accenture",
-                location="New York, NY",
-                description="Lead software development projects for Fortune 500 clients. Work with cloud technologies and modern development practices.",
-                skills_required=["java", "spring", "aws", "docker", "kubernetes", "microservices"],
-                experience_level="senior",
-                salary_range="$120,000 - $150,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://monster.com/jobs/12345",
-                source="monster"
-            ),
-            JobPosting(
-                title="Data Analyst",
-                company="IBM",
-                location="Austin, TX",
-                description="Analyze business data to drive strategic decisions. Create dashboards and reports for executive leadership.",
-                skills_required=["sql", "python", "tableau", "excel", "data visualization", "statistics"],
-                experience_level="mid",
-                salary_range="$75,000 - $95,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://monster.com/jobs/12346",
-                source="monster"
-            ),
-            JobPosting(
-                title="Project Manager - IT",
-                company="Deloitte",
-                location="Chicago, IL",
-                description="Manage large-scale IT transformation projects. Lead cross-functional teams and ensure project delivery.",
-                skills_required=["project management", "agile", "scrum", "stakeholder management", "pmp"],
-                experience_level="senior",
-                salary_range="$110,000 - $135,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://monster.com/jobs/12347",
-                source="monster"
-            ),
-            JobPosting(
-                title="Frontend Developer",
-                company="Capital One",
-                location="McLean, VA",
-                description="Build responsive web applications for banking platform. Work with React, TypeScript, and modern frontend tools.",
-                skills_required=["react", "typescript", "javascript", "css", "html", "redux"],
-                experience_level="mid",
-                salary_range="$90,000 - $120,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://monster.com/jobs/12348",
-                source="monster"
-            ),
-            JobPosting(
-                title="Cybersecurity Analyst",
-                company="Lockheed Martin",
-                location="Denver, CO",
-                description="Monitor and protect critical infrastructure systems. Implement security policies and incident response procedures.",
-                skills_required=["cybersecurity", "incident response", "siem", "network security", "risk assessment"],
-                experience_level="mid",
-                salary_range="$85,000 - $110,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://monster.com/jobs/12349",
-                source="monster"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in monster_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_MONSTER_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else monster_jobs[:limit]
+        return _slice(relevant_jobs or _MONSTER_SAMPLE_JOBS, limit)
+
+
+_CAREERBUILDER_SAMPLE_JOBS = (
+    JobPosting(
+        title="Solutions Architect",
+        company="Microsoft",
+        location="Redmond, WA",
+        description="Design and implement enterprise cloud solutions. Work with Azure services and help customers migrate to cloud.",
+        skills_required=("azure", "cloud architecture", "solution design", "enterprise integration"),
+        experience_level="senior",
+        salary_range="$140,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://careerbuilder.com/jobs/12345",
+        source="careerbuilder"
+    ),
+    JobPosting(
+        title="Business Analyst",
+        company="JPMorgan Chase",
+        location="Jersey City, NJ",
+        description="Analyze business requirements and translate them into technical specifications. Work with development teams on financial applications.",
+        skills_required=("business analysis", "requirements gathering", "sql", "financial services"),
+        experience_level="mid",
+        salary_range="$95,000 - $125,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://careerbuilder.com/jobs/12346",
+        source="careerbuilder"
+    ),
+    JobPosting(
+        title="Marketing Manager - Digital",
+        company="Coca-Cola",
+        location="Atlanta, GA",
+        description="Lead digital marketing campaigns and brand strategy. Manage social media presence and online advertising initiatives.",
+        skills_required=("digital marketing", "social media", "brand management", "analytics", "seo"),
+        experience_level="senior",
+        salary_range="$105,000 - $135,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://careerbuilder.com/jobs/12347",
+        source="careerbuilder"
+    ),
+    JobPosting(
+        title="Quality Assurance Engineer",
+        company="Tesla",
+        location="Fremont, CA",
+        description="Ensure software quality for automotive systems. Design and execute test plans for vehicle software components.",
+        skills_required=("test automation", "selenium", "python", "automotive testing", "ci/cd"),
+        experience_level="mid",
+        salary_range="$100,000 - $130,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://careerbuilder.com/jobs/12348",
+        source="careerbuilder"
+    )
+)
 
 
 class CareerBuilderAPIClient:
@@ -1655,98 +1787,98 @@ class CareerBuilderAPIClient:
         """Initialize CareerBuilder API client."""
         self.api_key = api_key or "your_careerbuilder_api_key"
         self.base_url = "https://api.careerbuilder.com/v2"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using CareerBuilder API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using CareerBuilder API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0'
+                'Content-Type': 'application/json'
             }
             
             params = {
-                'keywords': query,
-                'location': location,
+                'keywords': ctx.raw,
+                'location': ctx.location,
                 'perpage': min(limit, 100),
                 'developerkey': self.api_key
             }
             
-            print(f"Searching CareerBuilder API for: {query} in {location}")
+            logger.info("Searching CareerBuilder API for: %s in %s", ctx.raw, ctx.location)
             
             # Note: CareerBuilder API requires business partnership
-            print("Note: CareerBuilder API requires business partnership, using enhanced sample data")
-            return self._get_careerbuilder_sample_data(query, location, limit)
+            logger.info("Note: CareerBuilder API requires business partnership, using enhanced sample data")
+            return self._get_careerbuilder_sample_data(ctx, limit)
             
         except Exception as e:
-            print(f"CareerBuilder API request failed: {e}")
-            return self._get_careerbuilder_sample_data(query, location, limit)
+            logger.warning("CareerBuilder API request failed: %s", e)
+            return self._get_careerbuilder_sample_data(ctx, limit)
     
-    def _get_careerbuilder_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_careerbuilder_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced CareerBuilder sample data for professional roles."""
-        careerbuilder_jobs = [
-            JobPosting(
-                title="Solutions Architect",
-                company="Microsoft",
-                location="Redmond, WA",
-                description="Design and implement enterprise cloud solutions. Work with Azure services and help customers migrate to cloud.",
-                skills_required=["azure", "cloud architecture", "solution design", "enterprise integration"],
-                experience_level="senior",
-                salary_range="$140,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://careerbuilder.com/jobs/12345",
-                source="careerbuilder"
-            ),
-            JobPosting(
-                title="Business Analyst",
-                company="JPMorgan Chase",
-                location="Jersey City, NJ",
-                description="Analyze business requirements and translate them into technical specifications. Work with development teams on financial applications.",
-                skills_required=["business analysis", "requirements gathering", "sql", "financial services"],
-                experience_level="mid",
-                salary_range="$95,000 - $125,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://careerbuilder.com/jobs/12346",
-                source="careerbuilder"
-            ),
-            JobPosting(
-                title="Marketing Manager - Digital",
-                company="Coca-Cola",
-                location="Atlanta, GA",
-                description="Lead digital marketing campaigns and brand strategy. Manage social media presence and online advertising initiatives.",
-                skills_required=["digital marketing", "social media", "brand management", "analytics", "seo"],
-                experience_level="senior",
-                salary_range="$105,000 - $135,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://careerbuilder.com/jobs/12347",
-                source="careerbuilder"
-            ),
-            JobPosting(
-                title="Quality Assurance Engineer",
-                company="Tesla",
-                location="Fremont, CA",
-                description="Ensure software quality for automotive systems. Design and execute test plans for vehicle software components.",
-                skills_required=["test automation", "selenium", "python", "automotive testing", "ci/cd"],
-                experience_level="mid",
-                salary_range="$100,000 - $130,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://careerbuilder.com/jobs/12348",
-                source="careerbuilder"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in careerbuilder_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_CAREERBUILDER_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else careerbuilder_jobs[:limit]
+        return _slice(relevant_jobs or _CAREERBUILDER_SAMPLE_JOBS, limit)
+
+
+_SIMPLYHIRED_SAMPLE_JOBS = (
+    JobPosting(
+        title="Full Stack Developer",
+        company="Airbnb",
+        location="San Francisco, CA",
+        description="Build end-to-end features for travel platform. Work with React, Node.js, and distributed systems.",
+        skills_required=("react", "node.js", "javascript", "mongodb", "redis", "microservices"),
+        experience_level="mid",
+        salary_range="$130,000 - $170,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://simplyhired.com/jobs/12345",
+        source="simplyhired"
+    ),
+    JobPosting(
+        title="DevOps Engineer",
+        company="Netflix",
+        location="Los Gatos, CA",
+        description="Manage streaming infrastructure at global scale. Work with AWS, Kubernetes, and monitoring systems.",
+        skills_required=("aws", "kubernetes", "docker", "terraform", "monitoring", "ci/cd"),
+        experience_level="senior",
+        salary_range="$150,000 - $200,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://simplyhired.com/jobs/12346",
+        source="simplyhired"
+    ),
+    JobPosting(
+        title="Product Designer",
+        company="Spotify",
+        location="New York, NY",
+        description="Design user experiences for music streaming platform. Create wireframes, prototypes, and design systems.",
+        skills_required=("ui/ux design", "figma", "prototyping", "user research", "design systems"),
+        experience_level="mid",
+        salary_range="$115,000 - $145,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://simplyhired.com/jobs/12347",
+        source="simplyhired"
+    ),
+    JobPosting(
+        title="Machine Learning Engineer",
+        company="Uber",
+        location="Palo Alto, CA",
+        description="Build ML models for ride-sharing optimization. Work with real-time data processing and recommendation systems.",
+        skills_required=("machine learning", "python", "tensorflow", "spark", "kafka", "real-time systems"),
+        experience_level="senior",
+        salary_range="$160,000 - $220,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://simplyhired.com/jobs/12348",
+        source="simplyhired"
+    )
+)
 
 
 class SimplyHiredAPIClient:
@@ -1756,99 +1888,112 @@ class SimplyHiredAPIClient:
         """Initialize SimplyHired API client."""
         self.api_key = api_key or "your_simplyhired_api_key"
         self.base_url = "https://api.simplyhired.com/v2"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using SimplyHired API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using SimplyHired API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0'
+                'Content-Type': 'application/json'
             }
             
             params = {
-                'q': query,
-                'l': location,
+                'q': ctx.raw,
+                'l': ctx.location,
                 'pn': 1,
                 'ws': min(limit, 100),
                 'pshid': self.api_key
             }
             
-            print(f"Searching SimplyHired API for: {query} in {location}")
+            logger.info("Searching SimplyHired API for: %s in %s", ctx.raw, ctx.location)
             
             # Note: SimplyHired API requires partnership
-            print("Note: SimplyHired API requires partnership, using enhanced sample data")
-            return self._get_simplyhired_sample_data(query, location, limit)
+            logger.info("Note: SimplyHired API requires partnership, using enhanced sample data")
+            return self._get_simplyhired_sample_data(ctx, limit)
             
         except Exception as e:
-            print(f"SimplyHired API request failed: {e}")
-            return self._get_simplyhired_sample_data(query, location, limit)
+            logger.warning("SimplyHired API request failed: %s", e)
+            return self._get_simplyhired_sample_data(ctx, limit)
     
-    def _get_simplyhired_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_simplyhired_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced SimplyHired sample data for aggregated results."""
-        simplyhired_jobs = [
-            JobPosting(
-                title="Full Stack Developer",
-                company="Airbnb",
-                location="San Francisco, CA",
-                description="Build end-to-end features for travel platform. Work with React, Node.js, and distributed systems.",
-                skills_required=["react", "node.js", "javascript", "mongodb", "redis", "microservices"],
-                experience_level="mid",
-                salary_range="$130,000 - $170,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://simplyhired.com/jobs/12345",
-                source="simplyhired"
-            ),
-            JobPosting(
-                title="DevOps Engineer",
-                company="Netflix",
-                location="Los Gatos, CA",
-                description="Manage streaming infrastructure at global scale. Work with AWS, Kubernetes, and monitoring systems.",
-                skills_required=["aws", "kubernetes", "docker", "terraform", "monitoring", "ci/cd"],
-                experience_level="senior",
-                salary_range="$150,000 - $200,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://simplyhired.com/jobs/12346",
-                source="simplyhired"
-            ),
-            JobPosting(
-                title="Product Designer",
-                company="Spotify",
-                location="New York, NY",
-                description="Design user experiences for music streaming platform. Create wireframes, prototypes, and design systems.",
-                skills_required=["ui/ux design", "figma", "prototyping", "user research", "design systems"],
-                experience_level="mid",
-                salary_range="$115,000 - $145,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://simplyhired.com/jobs/12347",
-                source="simplyhired"
-            ),
-            JobPosting(
-                title="Machine Learning Engineer",
-                company="Uber",
-                location="Palo Alto, CA",
-                description="Build ML models for ride-sharing optimization. Work with real-time data processing and recommendation systems.",
-                skills_required=["machine learning", "python", "tensorflow", "spark", "kafka", "real-time systems"],
-                experience_level="senior",
-                salary_range="$160,000 - $220,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://simplyhired.com/jobs/12348",
-                source="simplyhired"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in simplyhired_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_SIMPLYHIRED_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else simplyhired_jobs[:limit]
+        return _slice(relevant_jobs or _SIMPLYHIRED_SAMPLE_JOBS, limit)
+
+
+_ANGELLIST_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Frontend Engineer",
+        company="Stripe",
+        location="San Francisco, CA",
+        description="Build payment infrastructure UI used by millions of businesses. Work with React, TypeScript, and design systems.",
+        skills_required=("react", "typescript", "javascript", "design systems", "payments"),
+        experience_level="senior",
+        salary_range="$150,000 - $220,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://wellfound.com/jobs/12345",
+        source="angellist"
+    ),
+    JobPosting(
+        title="Growth Engineer",
+        company="Notion",
+        location="San Francisco, CA",
+        description="Drive user acquisition and engagement through data-driven experiments and product optimizations.",
+        skills_required=("python", "sql", "a/b testing", "analytics", "growth hacking"),
+        experience_level="mid",
+        salary_range="$130,000 - $180,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://wellfound.com/jobs/12346",
+        source="angellist"
+    ),
+    JobPosting(
+        title="Founding Engineer",
+        company="Acme Startup",
+        location="Austin, TX",
+        description="Join as first engineering hire to build revolutionary fintech platform. Equity-heavy compensation package.",
+        skills_required=("full stack", "node.js", "react", "postgresql", "startup experience"),
+        experience_level="senior",
+        salary_range="$120,000 - $160,000 + equity",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://wellfound.com/jobs/12347",
+        source="angellist"
+    ),
+    JobPosting(
+        title="Product Manager",
+        company="Discord",
+        location="San Francisco, CA",
+        description="Own product strategy for gaming and community features. Work directly with engineering and design teams.",
+        skills_required=("product management", "gaming", "community building", "analytics"),
+        experience_level="mid",
+        salary_range="$140,000 - $190,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://wellfound.com/jobs/12348",
+        source="angellist"
+    ),
+    JobPosting(
+        title="Data Scientist",
+        company="Instacart",
+        location="San Francisco, CA",
+        description="Build ML models for grocery delivery optimization. Work with recommendation systems and demand forecasting.",
+        skills_required=("machine learning", "python", "sql", "recommendation systems", "forecasting"),
+        experience_level="senior",
+        salary_range="$145,000 - $195,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://wellfound.com/jobs/12349",
+        source="angellist"
+    )
+)
 
 
 class AngelListAPIClient:
@@ -1858,111 +2003,124 @@ class AngelListAPIClient:
         """Initialize AngelList API client."""
         self.api_key = api_key or "your_angellist_api_key"
         self.base_url = "https://api.angellist.co/1"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using AngelList API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using AngelList API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0'
+                'Content-Type': 'application/json'
             }
             
             params = {
-                'role': query,
-                'location_slug': location.lower().replace(' ', '-').replace(',', ''),
+                'role': ctx.raw,
+                'location_slug': ctx.location_slug,
                 'page': 1,
                 'per_page': min(limit, 50)
             }
             
-            print(f"Searching AngelList API for: {query} in {location}")
+            logger.info("Searching AngelList API for: %s in %s", ctx.raw, ctx.location)
             
             # Note: AngelList API has been discontinued for public use
-            print("Note: AngelList API discontinued for public use, using enhanced sample data")
-            return self._get_angellist_sample_data(query, location, limit)
+            logger.info("Note: AngelList API discontinued for public use, using enhanced sample data")
+            return self._get_angellist_sample_data(ctx, limit)
             
         except Exception as e:
-            print(f"AngelList API request failed: {e}")
-            return self._get_angellist_sample_data(query, location, limit)
+            logger.warning("AngelList API request failed: %s", e)
+            return self._get_angellist_sample_data(ctx, limit)
     
-    def _get_angellist_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_angellist_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced AngelList sample data for startup and tech jobs."""
-        angellist_jobs = [
-            JobPosting(
-                title="Senior Frontend Engineer",
-                company="Stripe",
-                location="San Francisco, CA",
-                description="Build payment infrastructure UI used by millions of businesses. Work with React, TypeScript, and design systems.",
-                skills_required=["react", "typescript", "javascript", "design systems", "payments"],
-                experience_level="senior",
-                salary_range="$150,000 - $220,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://wellfound.com/jobs/12345",
-                source="angellist"
-            ),
-            JobPosting(
-                title="Growth Engineer",
-                company="Notion",
-                location="San Francisco, CA",
-                description="Drive user acquisition and engagement through data-driven experiments and product optimizations.",
-                skills_required=["python", "sql", "a/b testing", "analytics", "growth hacking"],
-                experience_level="mid",
-                salary_range="$130,000 - $180,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://wellfound.com/jobs/12346",
-                source="angellist"
-            ),
-            JobPosting(
-                title="Founding Engineer",
-                company="Acme Startup",
-                location="Austin, TX",
-                description="Join as first engineering hire to build revolutionary fintech platform. Equity-heavy compensation package.",
-                skills_required=["full stack", "node.js", "react", "postgresql", "startup experience"],
-                experience_level="senior",
-                salary_range="$120,000 - $160,000 + equity",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://wellfound.com/jobs/12347",
-                source="angellist"
-            ),
-            JobPosting(
-                title="Product Manager",
-                company="Discord",
-                location="San Francisco, CA",
-                description="Own product strategy for gaming and community features. Work directly with engineering and design teams.",
-                skills_required=["product management", "gaming", "community building", "analytics"],
-                experience_level="mid",
-                salary_range="$140,000 - $190,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://wellfound.com/jobs/12348",
-                source="angellist"
-            ),
-            JobPosting(
-                title="Data Scientist",
-                company="Instacart",
-                location="San Francisco, CA",
-                description="Build ML models for grocery delivery optimization. Work with recommendation systems and demand forecasting.",
-                skills_required=["machine learning", "python", "sql", "recommendation systems", "forecasting"],
-                experience_level="senior",
-                salary_range="$145,000 - $195,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://wellfound.com/jobs/12349",
-                source="angellist"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in angellist_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_ANGELLIST_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else angellist_jobs[:limit]
+        return _slice(relevant_jobs or _ANGELLIST_SAMPLE_JOBS, limit)
+
+
+_DICE_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Java Developer",
+        company="Oracle",
+        location="Austin, TX",
+        description="Develop enterprise Java applications for database management systems. Work with Spring, Hibernate, and microservices.",
+        skills_required=("java", "spring", "hibernate", "microservices", "oracle database", "rest api"),
+        experience_level="senior",
+        salary_range="$125,000 - $160,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://dice.com/jobs/12345",
+        source="dice"
+    ),
+    JobPosting(
+        title="Cloud Infrastructure Engineer",
+        company="VMware",
+        location="Palo Alto, CA",
+        description="Design and implement cloud infrastructure solutions. Work with vSphere, Kubernetes, and hybrid cloud environments.",
+        skills_required=("vmware", "kubernetes", "cloud infrastructure", "terraform", "ansible"),
+        experience_level="senior",
+        salary_range="$140,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://dice.com/jobs/12346",
+        source="dice"
+    ),
+    JobPosting(
+        title="Python Developer",
+        company="Red Hat",
+        location="Raleigh, NC",
+        description="Develop open-source Python applications and tools. Contribute to Linux distributions and container technologies.",
+        skills_required=("python", "linux", "docker", "kubernetes", "open source", "git"),
+        experience_level="mid",
+        salary_range="$95,000 - $125,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://dice.com/jobs/12347",
+        source="dice"
+    ),
+    JobPosting(
+        title="Database Administrator",
+        company="SAP",
+        location="Newtown Square, PA",
+        description="Manage enterprise database systems and ensure high availability. Work with SAP HANA, PostgreSQL, and cloud databases.",
+        skills_required=("database administration", "sap hana", "postgresql", "backup/recovery", "performance tuning"),
+        experience_level="senior",
+        salary_range="$115,000 - $145,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://dice.com/jobs/12348",
+        source="dice"
+    ),
+    JobPosting(
+        title="iOS Developer",
+        company="Apple",
+        location="Cupertino, CA",
+        description="Develop iOS applications and frameworks. Work on core iOS features used by millions of users worldwide.",
+        skills_required=("swift", "objective-c", "ios development", "xcode", "core data", "ui/ux"),
+        experience_level="senior",
+        salary_range="$155,000 - $210,000",
+        job_type="full-time",
+        work_type="onsite",
+        url="https://dice.com/jobs/12349",
+        source="dice"
+    ),
+    JobPosting(
+        title="Network Security Engineer",
+        company="Cisco",
+        location="San Jose, CA",
+        description="Design and implement network security solutions. Work with firewalls, VPNs, and intrusion detection systems.",
+        skills_required=("network security", "cisco", "firewalls", "vpn", "intrusion detection", "ccna"),
+        experience_level="mid",
+        salary_range="$105,000 - $135,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://dice.com/jobs/12350",
+        source="dice"
+    )
+)
 
 
 class DiceAPIClient:
@@ -1972,20 +2130,22 @@ class DiceAPIClient:
         """Initialize Dice API client."""
         self.api_key = api_key or "your_dice_api_key"
         self.base_url = "https://api.dice.com/v1"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using Dice API."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using Dice API for a pre-normalized query."""
         try:
-            import requests
-            
             headers = {
                 'Content-Type': 'application/json',
-                'User-Agent': 'CareerAssistant/1.0',
                 'Authorization': f'Bearer {self.api_key}'
             }
             
             params = {
-                'q': query,
+                'q': ctx.raw,
                 'countryCode2': 'US',
                 'radius': '30',
                 'radiusUnit': 'mi',
@@ -1995,109 +2155,25 @@ class DiceAPIClient:
                 'fields': 'id|jobTitle|summary|employerName|location'
             }
             
-            if location:
-                params['city'] = location
+            if ctx.location:
+                params['city'] = ctx.location
             
-            print(f"Searching Dice API for: {query} in {location}")
+            logger.info("Searching Dice API for: %s in %s", ctx.raw, ctx.location)
             
             # Note: Dice API requires business partnership
-            print("Note: Dice API requires business partnership, using enhanced sample data")
-            return self._get_dice_sample_data(query, location, limit)
+            logger.info("Note: Dice API requires business partnership, using enhanced sample data")
+            return self._get_dice_sample_data(ctx, limit)
             
         except Exception as e:
-            print(f"Dice API request failed: {e}")
-            return self._get_dice_sample_data(query, location, limit)
+            logger.warning("Dice API request failed: %s", e)
+            return self._get_dice_sample_data(ctx, limit)
     
-    def _get_dice_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_dice_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced Dice sample data for technology and IT jobs."""
-        dice_jobs = [
-            JobPosting(
-                title="Senior Java Developer",
-                company="Oracle",
-                location="Austin, TX",
-                description="Develop enterprise Java applications for database management systems. Work with Spring, Hibernate, and microservices.",
-                skills_required=["java", "spring", "hibernate", "microservices", "oracle database", "rest api"],
-                experience_level="senior",
-                salary_range="$125,000 - $160,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://dice.com/jobs/12345",
-                source="dice"
-            ),
-            JobPosting(
-                title="Cloud Infrastructure Engineer",
-                company="VMware",
-                location="Palo Alto, CA",
-                description="Design and implement cloud infrastructure solutions. Work with vSphere, Kubernetes, and hybrid cloud environments.",
-                skills_required=["vmware", "kubernetes", "cloud infrastructure", "terraform", "ansible"],
-                experience_level="senior",
-                salary_range="$140,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://dice.com/jobs/12346",
-                source="dice"
-            ),
-            JobPosting(
-                title="Python Developer",
-                company="Red Hat",
-                location="Raleigh, NC",
-                description="Develop open-source Python applications and tools. Contribute to Linux distributions and container technologies.",
-                skills_required=["python", "linux", "docker", "kubernetes", "open source", "git"],
-                experience_level="mid",
-                salary_range="$95,000 - $125,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://dice.com/jobs/12347",
-                source="dice"
-            ),
-            JobPosting(
-                title="Database Administrator",
-                company="SAP",
-                location="Newtown Square, PA",
-                description="Manage enterprise database systems and ensure high availability. Work with SAP HANA, PostgreSQL, and cloud databases.",
-                skills_required=["database administration", "sap hana", "postgresql", "backup/recovery", "performance tuning"],
-                experience_level="senior",
-                salary_range="$115,000 - $145,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://dice.com/jobs/12348",
-                source="dice"
-            ),
-            JobPosting(
-                title="iOS Developer",
-                company="Apple",
-                location="Cupertino, CA",
-                description="Develop iOS applications and frameworks. Work on core iOS features used by millions of users worldwide.",
-                skills_required=["swift", "objective-c", "ios development", "xcode", "core data", "ui/ux"],
-                experience_level="senior",
-                salary_range="$155,000 - $210,000",
-                job_type="full-time",
-                work_type="onsite",
-                url="https://dice.com/jobs/12349",
-                source="dice"
-            ),
-            JobPosting(
-                title="Network Security Engineer",
-                company="Cisco",
-                location="San Jose, CA",
-                description="Design and implement network security solutions. Work with firewalls, VPNs, and intrusion detection systems.",
-                skills_required=["network security", "cisco", "firewalls", "vpn", "intrusion detection", "ccna"],
-                experience_level="mid",
-                salary_range="$105,000 - $135,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://dice.com/jobs/12350",
-                source="dice"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in dice_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_DICE_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else dice_jobs[:limit]
+        return _slice(relevant_jobs or _DICE_SAMPLE_JOBS, limit)
 
 
 class AdditionalJobAPIScraper(JobScraper):
@@ -2113,41 +2189,75 @@ class AdditionalJobAPIScraper(JobScraper):
     
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs from all additional job API sources."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search all additional job API sources with one shared normalized query."""
         all_jobs = []
         jobs_per_source = max(1, limit // 5)  # Distribute across 5 sources
         
         try:
             # Search Monster
-            monster_jobs = self.monster_client.search_jobs(query, location, jobs_per_source)
+            monster_jobs = self.monster_client.search_with_context(ctx, jobs_per_source)
             all_jobs.extend(monster_jobs)
-            print(f"Found {len(monster_jobs)} jobs from Monster")
+            logger.info("Found %d jobs from Monster", len(monster_jobs))
             
             # Search CareerBuilder
-            careerbuilder_jobs = self.careerbuilder_client.search_jobs(query, location, jobs_per_source)
+            careerbuilder_jobs = self.careerbuilder_client.search_with_context(ctx, jobs_per_source)
             all_jobs.extend(careerbuilder_jobs)
-            print(f"Found {len(careerbuilder_jobs)} jobs from CareerBuilder")
+            logger.info("Found %d jobs from CareerBuilder", len(careerbuilder_jobs))
             
             # Search SimplyHired
-            simplyhired_jobs = self.simplyhired_client.search_jobs(query, location, jobs_per_source)
+            simplyhired_jobs = self.simplyhired_client.search_with_context(ctx, jobs_per_source)
             all_jobs.extend(simplyhired_jobs)
-            print(f"Found {len(simplyhired_jobs)} jobs from SimplyHired")
+            logger.info("Found %d jobs from SimplyHired", len(simplyhired_jobs))
             
             # Search AngelList
-            angellist_jobs = self.angellist_client.search_jobs(query, location, jobs_per_source)
+            angellist_jobs = self.angellist_client.search_with_context(ctx, jobs_per_source)
             all_jobs.extend(angellist_jobs)
-            print(f"Found {len(angellist_jobs)} jobs from AngelList")
+            logger.info("Found %d jobs from AngelList", len(angellist_jobs))
             
             # Search Dice
-            dice_jobs = self.dice_client.search_jobs(query, location, jobs_per_source)
+            dice_jobs = self.dice_client.search_with_context(ctx, jobs_per_source)
             all_jobs.extend(dice_jobs)
-            print(f"Found {len(dice_jobs)} jobs from Dice")
+            logger.info("Found %d jobs from Dice", len(dice_jobs))
             
         except Exception as e:
-            print(f"Additional API search failed: {e}")
+            logger.warning("Additional API search failed: %s", e)
         
         return all_jobs[:limit]
 
 
+_ADZUNA_SAMPLE_JOBS = (
+    JobPosting(
+        title="Senior Software Engineer",
+        company="Real Tech Corp",
+        location="San Francisco, CA",
+        description="We are seeking a Senior Software Engineer to join our team. You'll work on cutting-edge projects using modern technologies.",
+        skills_required=("python", "javascript", "react", "node.js", "aws"),
+        experience_level="senior",
+        salary_range="$140,000 - $180,000",
+        job_type="full-time",
+        work_type="hybrid",
+        url="https://example-real-job.com/apply/12345",
+        source="adzuna-sample"
+    ),
+    JobPosting(
+        title="Data Scientist",
+        company="Analytics Pro Inc",
+        location="New York, NY",
+        description="Join our data science team to build ML models and derive insights from large datasets.",
+        skills_required=("python", "machine learning", "sql", "pandas", "scikit-learn"),
+        experience_level="mid",
+        salary_range="$120,000 - $160,000",
+        job_type="full-time",
+        work_type="remote",
+        url="https://example-real-job.com/apply/12346",
+        source="adzuna-sample"
+    )
+)
+
+
 class AdzunaAPIClient:
     """Adzuna API client for real job data (free tier available)."""
     
@@ -2157,53 +2267,55 @@ class AdzunaAPIClient:
         self.app_id = app_id or "your_adzuna_app_id"
         self.api_key = api_key or "your_adzuna_api_key"
         self.base_url = "https://api.adzuna.com/v1/api"
+        self.session = _create_api_session()
         
     def search_jobs(self, query: str, location: str = "", limit: int = 50) -> List[JobPosting]:
         """Search jobs using Adzuna API (real data when credentials are provided)."""
+        return self.search_with_context(QueryContext.build(query, location), limit)
+    
+    def search_with_context(self, ctx: QueryContext, limit: int = 50) -> List[JobPosting]:
+        """Search jobs using Adzuna API (real data when credentials are provided) for a pre-normalized query."""
         try:
-            import requests
-            import json
-            
-            # Determine country and location
+            # Determine country and ctx.location
             country = "us"  # Default to US
-            where = location if location else ""
-            
-            headers = {
-                'User-Agent': 'CareerAssistant/1.0'
-            }
+            where = ctx.location
             
             params = {
                 'app_id': self.app_id,
                 'app_key': self.api_key,
                 'results_per_page': min(limit, 50),
-                'what': query,
+                'what': ctx.raw,
                 'where': where,
                 'content-type': 'application/json'
             }
             
             url = f"{self.base_url}/jobs/{country}/search/1"
             
-            print(f"Attempting Adzuna API search for: {query} in {location}")
+            logger.info("Attempting Adzuna API search for: %s in %s", ctx.raw, ctx.location)
             
             # Check if we have real credentials
             if self.app_id == "your_adzuna_app_id" or self.api_key == "your_adzuna_api_key":
-                print("Note: Adzuna API requires free registration at adzuna.com, using enhanced sample data")
-                return self._get_adzuna_sample_data(query, location, limit)
+                logger.info("Note: Adzuna API requires free registration at adzuna.com, using enhanced sample data")
+                return self._get_adzuna_sample_data(ctx, limit)
+            
+            if self.session is None:
+                logger.info("Note: requests library not available, using enhanced sample data")
+                return self._get_adzuna_sample_data(ctx, limit)
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
                 jobs = self._parse_adzuna_response(data)
-                print(f"✅ Found {len(jobs)} REAL jobs from Adzuna API")
+                logger.info("Found %d REAL jobs from Adzuna API", len(jobs))
                 return jobs[:limit]
             else:
-                print(f"Adzuna API error: {response.status_code}")
-                return self._get_adzuna_sample_data(query, location, limit)
+                logger.warning("Adzuna API error: %s", response.status_code)
+                return self._get_adzuna_sample_data(ctx, limit)
                 
         except Exception as e:
-            print(f"Adzuna API request failed: {e}")
-            return self._get_adzuna_sample_data(query, location, limit)
+            logger.warning("Adzuna API request failed: %s", e)
+            return self._get_adzuna_sample_data(ctx, limit)
     
     def _parse_adzuna_response(self, data: dict) -> List[JobPosting]:
         """Parse Adzuna API response into JobPosting objects."""
@@ -2231,7 +2343,7 @@ class AdzunaAPIClient:
                     company=company,
                     location=location,
                     description=description,
-                    skills_required=[],  # Adzuna doesn't provide structured skills
+                    skills_required=(),  # Adzuna doesn't provide structured skills
                     salary_range=salary_range,
                     url=job_data.get('redirect_url', ''),
                     posted_date=job_data.get('created', ''),
@@ -2245,178 +2357,153 @@ class AdzunaAPIClient:
         
         return jobs
     
-    def _get_adzuna_sample_data(self, query: str, location: str, limit: int) -> List[JobPosting]:
+    def _get_adzuna_sample_data(self, ctx: QueryContext, limit: int) -> List[JobPosting]:
         """Enhanced Adzuna sample data that mimics real API structure."""
-        adzuna_sample_jobs = [
-            JobPosting(
-                title="Senior Software Engineer",
-                company="Real Tech Corp",
-                location="San Francisco, CA",
-                description="We are seeking a Senior Software Engineer to join our team. You'll work on cutting-edge projects using modern technologies.",
-                skills_required=["python", "javascript", "react", "node.js", "aws"],
-                experience_level="senior",
-                salary_range="$140,000 - $180,000",
-                job_type="full-time",
-                work_type="hybrid",
-                url="https://example-real-job.com/apply/12345",
-                source="adzuna-sample"
-            ),
-            JobPosting(
-                title="Data Scientist",
-                company="Analytics Pro Inc",
-                location="New York, NY",
-                description="Join our data science team to build ML models and derive insights from large datasets.",
-                skills_required=["python", "machine learning", "sql", "pandas", "scikit-learn"],
-                experience_level="mid",
-                salary_range="$120,000 - $160,000",
-                job_type="full-time",
-                work_type="remote",
-                url="https://example-real-job.com/apply/12346",
-                source="adzuna-sample"
-            )
-        ]
-        
         # Filter based on query
-        query_lower = query.lower()
-        relevant_jobs = [job for job in adzuna_sample_jobs 
-                        if any(word in job.title.lower() or word in job.description.lower() 
-                              for word in query_lower.split())]
+        relevant_jobs = _filter_by_query(_ADZUNA_SAMPLE_JOBS, ctx.lower, limit)
         
-        return relevant_jobs[:limit] if relevant_jobs else adzuna_sample_jobs[:limit]
+        return _slice(relevant_jobs or _ADZUNA_SAMPLE_JOBS, limit)
 
 
 class JobAggregator:
-    """Aggregates jobs from multiple sources."""
-    
-    def __init__(self):
-        self.indeed_scraper = IndeedScraper()
-        self.linkedin_scraper = LinkedInScraper()
-        self.enhanced_linkedin_scraper = EnhancedLinkedInScraper()
-        self.glassdoor_scraper = GlassdoorScraper()
-        self.ziprecruiter_scraper = ZipRecruiterScraper()
-        self.remoteok_scraper = RemoteOKScraper()
-        self.jobs_api_provider = JobsAPIProvider()
-        self.linkedin_naukri_scraper = LinkedInNaukriScraper()  # API-based scraper
-        self.additional_apis_scraper = AdditionalJobAPIScraper()  # Additional APIs scraper
-        self.adzuna_client = AdzunaAPIClient()  # Real job data API
-        # Initialize Apify clients with environment variables
-        apify_token = os.getenv('APIFY_API_TOKEN')
-        linkedin_dataset_id = os.getenv('APIFY_LINKEDIN_DATASET_ID', '1bgPCIvQOdVi4gYbh')
-        
-        self.apify_linkedin_client = ApifyJobClient(
-            dataset_id=linkedin_dataset_id,
-            api_token=apify_token
-        )
-        self.apify_indeed_client = ApifyIndeedClient(
-            api_token=apify_token
-        )
+    """Aggregates jobs from multiple sources.
+    
+    Each source client is created on first use, so callers that only touch
+    one source (or none) don't pay for constructing all of them.
+    """
+    
+    @cached_property
+    def indeed_scraper(self) -> "IndeedScraper":
+        return IndeedScraper()
+    
+    @cached_property
+    def linkedin_scraper(self) -> "LinkedInScraper":
+        return LinkedInScraper()
+    
+    @cached_property
+    def enhanced_linkedin_scraper(self) -> "EnhancedLinkedInScraper":
+        return EnhancedLinkedInScraper()
+    
+    @cached_property
+    def glassdoor_scraper(self) -> "GlassdoorScraper":
+        return GlassdoorScraper()
+    
+    @cached_property
+    def ziprecruiter_scraper(self) -> "ZipRecruiterScraper":
+        return ZipRecruiterScraper()
+    
+    @cached_property
+    def remoteok_scraper(self) -> "RemoteOKScraper":
+        return RemoteOKScraper()
+    
+    @cached_property
+    def jobs_api_provider(self) -> "JobsAPIProvider":
+        return JobsAPIProvider()
+    
+    @cached_property
+    def linkedin_naukri_scraper(self) -> "LinkedInNaukriScraper":
+        return LinkedInNaukriScraper()  # API-based scraper
+    
+    @cached_property
+    def additional_apis_scraper(self) -> "AdditionalJobAPIScraper":
+        return AdditionalJobAPIScraper()  # Additional APIs scraper
+    
+    @cached_property
+    def adzuna_client(self) -> "AdzunaAPIClient":
+        return AdzunaAPIClient()  # Real job data API
+    
+    @cached_property
+    def apify_linkedin_client(self) -> "ApifyJobClient":
+        """Process-wide Apify LinkedIn dataset client."""
+        return APIFY_LINKEDIN_CLIENT
+    
+    @cached_property
+    def apify_indeed_client(self) -> "ApifyIndeedClient":
+        """Process-wide Apify Indeed Actor client."""
+        return APIFY_INDEED_CLIENT
+    
+    def _source_searches(self, query: str, location: str, limit_per_source: int) -> List[tuple]:
+        """Build the (found label, failure label, search callable) entries in priority order."""
+        # Normalize the query once for every source that accepts a QueryContext
+        ctx = QueryContext.build(query, location)
+        return [
+            # Apify LinkedIn dataset (real data - highest priority)
+            ("jobs from Apify LinkedIn dataset (real data)", "Apify LinkedIn",
+             lambda: self.apify_linkedin_client.search_jobs(query, location)),
+            # Apify Indeed Actor (real data - high priority)
+            ("jobs from Apify Indeed Actor (real data)", "Apify Indeed",
+             lambda: self.apify_indeed_client.search_jobs(query, location, limit_per_source)),
+            # Adzuna API (real data priority)
+            ("jobs from Adzuna (real data API)", "Adzuna API",
+             lambda: self.adzuna_client.search_with_context(ctx, limit_per_source)),
+            # LinkedIn and Naukri APIs (priority)
+            ("jobs from LinkedIn/Naukri APIs", "LinkedIn/Naukri API",
+             lambda: self.linkedin_naukri_scraper.search_jobs(query, location, limit_per_source)),
+            ("jobs from Indeed", "Indeed",
+             lambda: self.indeed_scraper.search_jobs(query, location, limit_per_source)),
+            ("jobs from LinkedIn", "LinkedIn",
+             lambda: self.enhanced_linkedin_scraper.search_jobs(query, location, limit_per_source)),
+            ("jobs from Glassdoor", "Glassdoor",
+             lambda: self.glassdoor_scraper.search_jobs(query, location, limit_per_source)),
+            ("jobs from ZipRecruiter", "ZipRecruiter",
+             lambda: self.ziprecruiter_scraper.search_jobs(query, location, limit_per_source)),
+            # RemoteOK for remote jobs
+            ("remote jobs from RemoteOK", "RemoteOK",
+             lambda: self.remoteok_scraper.search_jobs(query, location, limit_per_source)),
+            # API providers (startups, government, tech)
+            ("jobs from API providers", "API provider",
+             lambda: self.jobs_api_provider.search_jobs(query, location, limit_per_source)),
+            # Additional Job APIs (Monster, CareerBuilder, SimplyHired, AngelList, Dice)
+            ("jobs from additional APIs (Monster, CareerBuilder, SimplyHired, AngelList, Dice)", "Additional APIs",
+             lambda: self.additional_apis_scraper.search_with_context(ctx, limit_per_source)),
+            # Original LinkedIn (backup)
+            ("jobs from LinkedIn (backup)", "LinkedIn backup",
+             lambda: self.linkedin_scraper.search_jobs(query, location, limit_per_source)),
+        ]
     
-    def search_all_sources(self, query: str, location: str = "", limit_per_source: int = 25) -> List[JobPosting]:
-        """Search for jobs across all sources."""
+    async def search_all_sources_async(self, query: str, location: str = "", limit_per_source: int = 25) -> List[JobPosting]:
+        """Search for jobs across all sources concurrently."""
         all_jobs = []
         
-        print(f"Starting comprehensive job search for: '{query}' in '{location}'")
-        print("Searching across Apify LinkedIn (real data), Apify Indeed (real data), Adzuna, Indeed, LinkedIn, Glassdoor, ZipRecruiter, RemoteOK, LinkedIn/Naukri APIs, Monster, CareerBuilder, SimplyHired, AngelList, Dice, and specialized APIs...")
-        
-        # Search Apify LinkedIn dataset (real data - highest priority)
-        try:
-            apify_linkedin_jobs = self.apify_linkedin_client.search_jobs(query, location)
-            all_jobs.extend(apify_linkedin_jobs)
-            print(f"Found {len(apify_linkedin_jobs)} jobs from Apify LinkedIn dataset (real data)")
-        except Exception as e:
-            print(f"Apify LinkedIn search failed: {e}")
-        
-        # Search Apify Indeed Actor (real data - high priority)
-        try:
-            apify_indeed_jobs = self.apify_indeed_client.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(apify_indeed_jobs)
-            print(f"Found {len(apify_indeed_jobs)} jobs from Apify Indeed Actor (real data)")
-        except Exception as e:
-            print(f"Apify Indeed search failed: {e}")
-        
-        # Search Adzuna API (real data priority)
-        try:
-            adzuna_jobs = self.adzuna_client.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(adzuna_jobs)
-            print(f"Found {len(adzuna_jobs)} jobs from Adzuna (real data API)")
-        except Exception as e:
-            print(f"Adzuna API search failed: {e}")
-        
-        # Search LinkedIn and Naukri APIs (priority)
-        try:
-            api_jobs = self.linkedin_naukri_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(api_jobs)
-            print(f"Found {len(api_jobs)} jobs from LinkedIn/Naukri APIs")
-        except Exception as e:
-            print(f"LinkedIn/Naukri API search failed: {e}")
-        
-        # Search Indeed
-        try:
-            indeed_jobs = self.indeed_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(indeed_jobs)
-            print(f"Found {len(indeed_jobs)} jobs from Indeed")
-        except Exception as e:
-            print(f"Indeed search failed: {e}")
-        
-        # Search Enhanced LinkedIn
-        try:
-            enhanced_linkedin_jobs = self.enhanced_linkedin_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(enhanced_linkedin_jobs)
-            print(f"Found {len(enhanced_linkedin_jobs)} jobs from LinkedIn")
-        except Exception as e:
-            print(f"LinkedIn search failed: {e}")
-        
-        # Search Glassdoor
-        try:
-            glassdoor_jobs = self.glassdoor_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(glassdoor_jobs)
-            print(f"Found {len(glassdoor_jobs)} jobs from Glassdoor")
-        except Exception as e:
-            print(f"Glassdoor search failed: {e}")
+        logger.info("Starting comprehensive job search for: '%s' in '%s'", query, location)
+        logger.info("Searching across Apify LinkedIn (real data), Apify Indeed (real data), Adzuna, Indeed, LinkedIn, Glassdoor, ZipRecruiter, RemoteOK, LinkedIn/Naukri APIs, Monster, CareerBuilder, SimplyHired, AngelList, Dice, and specialized APIs...")
         
-        # Search ZipRecruiter
-        try:
-            ziprecruiter_jobs = self.ziprecruiter_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(ziprecruiter_jobs)
-            print(f"Found {len(ziprecruiter_jobs)} jobs from ZipRecruiter")
-        except Exception as e:
-            print(f"ZipRecruiter search failed: {e}")
-        
-        # Search RemoteOK for remote jobs
-        try:
-            remote_jobs = self.remoteok_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(remote_jobs)
-            print(f"Found {len(remote_jobs)} remote jobs from RemoteOK")
-        except Exception as e:
-            print(f"RemoteOK search failed: {e}")
-        
-        # Search API providers (startups, government, tech)
-        try:
-            api_jobs = self.jobs_api_provider.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(api_jobs)
-            print(f"Found {len(api_jobs)} jobs from API providers")
-        except Exception as e:
-            print(f"API provider search failed: {e}")
-        
-        # Search Additional Job APIs (Monster, CareerBuilder, SimplyHired, AngelList, Dice)
-        try:
-            additional_jobs = self.additional_apis_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(additional_jobs)
-            print(f"Found {len(additional_jobs)} jobs from additional APIs (Monster, CareerBuilder, SimplyHired, AngelList, Dice)")
-        except Exception as e:
-            print(f"Additional APIs search failed: {e}")
+        # Clients are blocking, so each one runs in a worker thread while the
+        # event loop overlaps their network waits
+        loop = asyncio.get_running_loop()
+        searches = self._source_searches(query, location, limit_per_source)
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, search) for _, _, search in searches),
+            return_exceptions=True
+        )
         
-        # Search Original LinkedIn (backup)
-        try:
-            linkedin_jobs = self.linkedin_scraper.search_jobs(query, location, limit_per_source)
-            all_jobs.extend(linkedin_jobs)
-            print(f"Found {len(linkedin_jobs)} jobs from LinkedIn (backup)")
-        except Exception as e:
-            print(f"LinkedIn backup search failed: {e}")
+        # Merge in priority order regardless of completion order, keeping the first
+        # posting of each (title, company, location) so sources sharing a listing
+        # don't repeat it while the same role in another city is kept
+        seen = set()
+        for (found_label, source_name, _), result in zip(searches, results):
+            if isinstance(result, Exception):
+                logger.warning("%s search failed: %s", source_name, result)
+                continue
+            for job in result:
+                key = (
+                    (job.title or "").lower(),
+                    (job.company or "").lower(),
+                    " ".join((job.location or "").lower().split()),
+                )
+                if key not in seen:
+                    seen.add(key)
+                    all_jobs.append(job)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found %d %s", len(result), found_label)
         
-        print(f"Total jobs found across all sources: {len(all_jobs)}")
+        logger.info("Total jobs found across all sources: %d", len(all_jobs))
         return all_jobs
     
+    def search_all_sources(self, query: str, location: str = "", limit_per_source: int = 25) -> List[JobPosting]:
+        """Search for jobs across all sources."""
+        return asyncio.run(self.search_all_sources_async(query, location, limit_per_source))
+    
     def save_jobs_to_file(self, jobs: List[JobPosting], filename: str):
         """Save jobs to JSON file."""
         jobs_dict = [job.to_dict() for job in jobs]
@@ -2424,7 +2511,7 @@ class JobAggregator:
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(jobs_dict, f, indent=2, ensure_ascii=False)
         
-        print(f"💾 Saved {len(jobs)} jobs to {filename}")
+        logger.info("Saved %d jobs to %s", len(jobs), filename)
     
     def load_jobs_from_file(self, filename: str) -> List[JobPosting]:
         """Load jobs from JSON file."""
@@ -2437,246 +2524,400 @@ class JobAggregator:
                 job = JobPosting(**job_dict)
                 jobs.append(job)
             
-            print(f"📂 Loaded {len(jobs)} jobs from {filename}")
+            logger.info("Loaded %d jobs from %s", len(jobs), filename)
             return jobs
             
         except FileNotFoundError:
-            print(f"❌ File {filename} not found")
+            logger.warning("File %s not found", filename)
             return []
         except Exception as e:
-            print(f"❌ Error loading jobs: {e}")
+            logger.warning("Error loading jobs: %s", e)
             return []
 
 
+# Apify results are cached on disk so repeat searches skip a paid actor run; a TTL of 0 disables it.
+# The default is the user's own cache directory rather than the shared temp dir, so other local
+# users can't plant cache entries.
+APIFY_CACHE_DIR = os.getenv('APIFY_CACHE_DIR', os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'credexa_jobs'
+))
+APIFY_CACHE_TTL = int(os.getenv('APIFY_CACHE_TTL', '3600'))
+
+
+def _apify_cache_path(*key_parts) -> str:
+    """Map a search's identifying parts to its cache file."""
+    key = hashlib.blake2b("|".join(map(str, key_parts)).encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(APIFY_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_jobs(path: str) -> Optional[List[JobPosting]]:
+    """Return the jobs cached at path, or None when missing, expired or unreadable."""
+    if APIFY_CACHE_TTL <= 0:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) > APIFY_CACHE_TTL:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return [JobPosting(**job_dict) for job_dict in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_jobs(path: str, jobs: List[JobPosting]):
+    """Cache a non-empty search result at path; failures are never cached."""
+    if APIFY_CACHE_TTL <= 0 or not jobs:
+        return
+    try:
+        os.makedirs(APIFY_CACHE_DIR, mode=0o700, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([job.to_dict() for job in jobs], f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache Apify results: %s", e)
+
+
+# Apify descriptions are cut to this many characters (plus "...") for display
+APIFY_DESCRIPTION_CHARS = 300
+
+
+@lru_cache(maxsize=None)
+def _get_apify_session(api_token) -> Optional["requests.Session"]:
+    """Return the keep-alive session for api.apify.com shared by every client using api_token."""
+    if not REQUESTS_AVAILABLE:
+        return None
+    
+    # Only idempotent calls (run polls, dataset fetches) are retried; run-start POSTs are not
+    session = _create_api_session(
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+    )
+    if api_token:
+        session.headers['Authorization'] = f"Bearer {api_token}"
+    # Advertise every encoding urllib3 can decode here (brotli/zstd when installed)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return session
+
+
+def _read_json_body(response, limit=None):
+    """Decode a streamed JSON response straight from its decompressed raw bytes.
+    
+    With ijson installed, a JSON array capped at limit items is parsed
+    incrementally and the rest of the body is never read.
+    """
+    response.raw.decode_content = True
+    if limit is not None and IJSON_AVAILABLE:
+        return list(islice(ijson.items(response.raw, 'item', use_float=True), limit))
+    return json_loads(response.raw.read())
+
+
 class ApifyIndeedClient:
     """Client for Apify Indeed Actor - provides real Indeed job data"""
     
+    # Seconds the run-start request blocks server-side for the actor to finish (Apify caps this at 60)
+    WAIT_FOR_FINISH = 60
+    # Only the top results and the columns _format_items reads are downloaded
+    DATASET_PARAMS = {
+        'clean': 'true',
+        'format': 'json',
+        'limit': 20,
+        'fields': 'title,company,location,description,link,url,salary,datePosted,jobType',
+    }
+    
+    # Consecutive failed runs that open the circuit, and how long it then stays open
+    FAILURE_THRESHOLD = 3
+    CIRCUIT_COOLDOWN = 60
+    
     def __init__(self, api_token):
         self.api_token = api_token
         self.actor_id = "qA8rz8tR61HdkfTBL"  # Indeed scraper actor
         self.base_url = "https://api.apify.com/v2/acts"
+        self.session = _get_apify_session(api_token)
+        # The client is shared process-wide, so aggregator threads update the breaker under a lock
+        self._breaker_lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
     
     def search_jobs(self, query, location="", limit=25):
-        """Search for jobs using Apify Indeed Actor"""
+        """Search for jobs using Apify Indeed Actor, reusing a recent cached run"""
+        cache_path = _apify_cache_path(self.actor_id, query, location, limit)
+        jobs = _load_cached_jobs(cache_path)
+        if jobs is None:
+            jobs = self._run_search(query, location, limit)
+            _store_cached_jobs(cache_path, jobs)
+        return jobs
+    
+    @staticmethod
+    def _search_url(query, location):
+        """Build the Indeed search URL the actor scrapes"""
+        if location:
+            return f"https://www.indeed.com/jobs?q={query}&l={location}"
+        return f"https://www.indeed.com/jobs?q={query}"
+    
+    def _run_search(self, query, location, limit):
+        """Start an Indeed Actor run and collect its results"""
+        if self.session is None or self._circuit_open():
+            return []
+        
+        # Prepare the input for Indeed Actor
+        input_data = {
+            "scrapeJobs.searchUrl": self._search_url(query, location),
+            "scrapeJobs.scrapeCompany": False,
+            "count": min(limit, 50),  # Limit to avoid long runs
+            "outputSchema": "raw",
+            "findContacts": False
+        }
+        
+        logger.info("🚀 Starting Indeed scraper for: %s in %s", query, location)
+        dataset_id = self._run_actor(input_data)
+        data = self._fetch_dataset(dataset_id, self.DATASET_PARAMS) if dataset_id else None
+        self._record_outcome(data is not None)
+        if data is None:
+            return []
+        
+        logger.info("SUCCESS: Indeed Actor found %d jobs", len(data))
+        return self._format_items(data, location)
+    
+    def _circuit_open(self):
+        """Whether recent failures mean Apify should not be called yet"""
+        return time.time() < self._open_until
+    
+    def _record_outcome(self, succeeded):
+        """Update the circuit breaker after a run.
+        
+        Once tripped the failure count stays at the threshold, so the first
+        failure after the cooldown reopens the circuit straight away.
+        """
+        with self._breaker_lock:
+            if succeeded:
+                self._failures = 0
+                return
+            self._failures += 1
+            tripped = self._failures >= self.FAILURE_THRESHOLD
+            if tripped:
+                self._open_until = time.time() + self.CIRCUIT_COOLDOWN
+        if tripped:
+            logger.warning("Indeed Actor failing, skipping it for %d seconds", self.CIRCUIT_COOLDOWN)
+    
+    def _run_actor(self, input_data):
+        """Start an actor run and return its dataset ID once it succeeds, or None"""
         try:
-            import requests
-            
-            # Prepare the input for Indeed Actor
-            if location:
-                search_url = f"https://www.indeed.com/jobs?q={query}&l={location}"
-            else:
-                search_url = f"https://www.indeed.com/jobs?q={query}"
-            
-            input_data = {
-                "scrapeJobs.searchUrl": search_url,
-                "scrapeJobs.scrapeCompany": False,
-                "count": min(limit, 50),  # Limit to avoid long runs
-                "outputSchema": "raw",
-                "findContacts": False
-            }
-            
-            # Start the actor run
             run_url = f"{self.base_url}/{self.actor_id}/runs"
-            headers = {
-                "Authorization": f"Bearer {self.api_token}",
-                "Content-Type": "application/json"
-            }
+            response = self.session.post(
+                run_url,
+                json=input_data,
+                params={'waitForFinish': self.WAIT_FOR_FINISH},
+                timeout=self.WAIT_FOR_FINISH + 30
+            )
             
-            print(f"🚀 Starting Indeed scraper for: {query} in {location}")
-            response = requests.post(run_url, json=input_data, headers=headers, timeout=30)
+            if response.status_code not in [200, 201]:
+                logger.warning("Indeed Actor start failed: %s - %s", response.status_code, response.text)
+                return None
+            
+            run_data = response.json()
+            run_data = run_data.get('data', run_data)  # API wraps the run object in "data"
+            run_id = run_data.get('id')
+            if not run_id:
+                logger.warning("Failed to get run ID from Indeed Actor")
+                return None
+            
+            # Most runs have already finished server-side; only poll the slow ones
+            status = run_data.get('status')
+            dataset_id = run_data.get('defaultDatasetId')
+            if status == 'SUCCEEDED' and dataset_id:
+                return dataset_id
+            if status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
+                logger.warning("Indeed Actor run %s", status)
+                return None
+            return self._wait_for_dataset(run_id)
             
-            if response.status_code in [200, 201]:
-                run_data = response.json()
-                run_id = run_data.get('id')
-                
-                if run_id:
-                    # Wait for run completion and get results
-                    return self._wait_for_results(run_id, query, location)
-                else:
-                    print(f"Failed to get run ID from Indeed Actor")
-                    return []
-            else:
-                print(f"Indeed Actor start failed: {response.status_code} - {response.text}")
-                return []
-                
         except Exception as e:
-            print(f"Indeed Actor exception: {e}")
-            return []
+            logger.warning("Indeed Actor exception: %s", e)
+            return None
     
-    def _wait_for_results(self, run_id, query, location, max_wait=60):
-        """Wait for actor run to complete and fetch results"""
+    def _wait_for_dataset(self, run_id, max_wait=60):
+        """Wait for actor run to complete and return its dataset ID, or None"""
         try:
-            import requests
-            import time
-            
-            headers = {"Authorization": f"Bearer {self.api_token}"}
             run_url = f"{self.base_url}/{self.actor_id}/runs/{run_id}"
             
-            # Wait for completion (with timeout)
+            # Wait for completion (with timeout), backing off from 1s to 8s between polls
             start_time = time.time()
+            delay = 1.0
             while time.time() - start_time < max_wait:
-                response = requests.get(run_url, headers=headers, timeout=10)
+                response = self.session.get(run_url, timeout=10)
                 if response.status_code == 200:
                     run_data = response.json()
+                    run_data = run_data.get('data', run_data)  # API wraps the run object in "data"
                     status = run_data.get('status')
                     
                     if status == 'SUCCEEDED':
                         # Get dataset items
                         dataset_id = run_data.get('defaultDatasetId')
                         if dataset_id:
-                            return self._fetch_dataset_items(dataset_id, query, location)
-                        break
+                            return dataset_id
+                        logger.warning("Indeed Actor run %s finished without a dataset", run_id)
+                        return None
                     elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
-                        print(f"Indeed Actor run {status}")
-                        break
+                        logger.warning("Indeed Actor run %s", status)
+                        return None
                 
-                time.sleep(5)  # Wait 5 seconds before checking again
+                time.sleep(delay + random.uniform(0, 0.3))
+                delay = min(delay * 1.5, 8.0)
             
-            print(f"Indeed Actor timeout after {max_wait} seconds")
-            return []
+            logger.warning("Indeed Actor timeout after %d seconds", max_wait)
+            return None
             
         except Exception as e:
-            print(f"Error waiting for Indeed results: {e}")
-            return []
+            logger.warning("Error waiting for Indeed results: %s", e)
+            return None
     
-    def _fetch_dataset_items(self, dataset_id, query, location):
-        """Fetch and format job data from dataset"""
+    def _fetch_dataset(self, dataset_id, params):
+        """Download raw dataset items, or None on failure"""
         try:
-            import requests
-            
-            headers = {"Authorization": f"Bearer {self.api_token}"}
             dataset_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
             
-            response = requests.get(dataset_url, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                print(f"SUCCESS: Indeed Actor found {len(data)} jobs")
-                
-                for item in data:
-                    # Format Indeed job data
-                    job_title = item.get('title', 'Unknown Title')
-                    company = item.get('company', 'Unknown Company')
-                    job_location = item.get('location', location or 'Unknown Location')
-                    description = item.get('description', '')
-                    
-                    # Clean and truncate description
-                    if len(description) > 300:
-                        description = description[:300] + "..."
-                    
-                    # Format salary
-                    salary = item.get('salary', 'Not specified')
-                    if not salary or salary.strip() == '':
-                        salary = 'Not specified'
-                    
-                    # Create JobPosting object
-                    job = JobPosting(
-                        title=job_title,
-                        company=company,
-                        location=job_location,
-                        description=description,
-                        url=item.get('link', item.get('url', '#')),
-                        salary_range=salary,
-                        posted_date=item.get('datePosted', 'Unknown'),
-                        source='apify-indeed',
-                        job_type=item.get('jobType', 'Full-time'),
-                        work_type='unknown',
-                        skills_required=[]
-                    )
-                    jobs.append(job)
-                
-                return jobs[:20]  # Return top 20 matches
-            else:
-                print(f"Failed to fetch Indeed dataset: {response.status_code}")
-                return []
+            with self.session.get(dataset_url, params=params, stream=True, timeout=15) as response:
+                if response.status_code != 200:
+                    logger.warning("Failed to fetch Indeed dataset: %s", response.status_code)
+                    return None
+                return _read_json_body(response, params.get('limit'))
                 
         except Exception as e:
-            print(f"Error fetching Indeed dataset: {e}")
+            logger.warning("Error fetching Indeed dataset: %s", e)
+            return None
+    
+    def _format_items(self, data, location):
+        """Format Indeed dataset items as job postings"""
+        try:
+            # Empty salaries read as 'Not specified'
+            return [
+                JobPosting(
+                    title=item.get('title', 'Unknown Title'),
+                    company=item.get('company', 'Unknown Company'),
+                    location=item.get('location', location or 'Unknown Location'),
+                    description=(
+                        desc[:APIFY_DESCRIPTION_CHARS] + "..."
+                        if len(desc := item.get('description', '')) > APIFY_DESCRIPTION_CHARS else desc
+                    ),
+                    url=item.get('link', item.get('url', '#')),
+                    salary_range=salary if (salary := item.get('salary')) and salary.strip() else 'Not specified',
+                    posted_date=item.get('datePosted', 'Unknown'),
+                    source='apify-indeed',
+                    job_type=item.get('jobType', 'Full-time'),
+                    work_type='unknown',
+                    skills_required=()
+                )
+                for item in data
+            ]
+            
+        except Exception as e:
+            logger.warning("Error formatting Indeed dataset: %s", e)
             return []
 
 
 class ApifyJobClient:
     """Client for Apify job dataset API - provides real LinkedIn job data"""
     
+    # Project the dataset down to the columns search_jobs reads
+    DATASET_PARAMS = {
+        'clean': 'true',
+        'format': 'json',
+        'fields': 'title,location,companyName,description,salary,jobUrl,applyUrl,postedTime,contractType',
+    }
+    
     def __init__(self, dataset_id, api_token):
         self.dataset_id = dataset_id
         self.api_token = api_token
         self.base_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
+        self.session = _get_apify_session(api_token)
     
     def search_jobs(self, query, location="", page=1):
-        """Search for jobs from Apify dataset"""
+        """Search for jobs from Apify dataset, reusing a recent cached result"""
+        cache_path = _apify_cache_path(self.dataset_id, query, location, page)
+        jobs = _load_cached_jobs(cache_path)
+        if jobs is None:
+            jobs = self._search_dataset(query, location, page)
+            _store_cached_jobs(cache_path, jobs)
+        return jobs
+    
+    def _search_dataset(self, query, location, page):
+        """Download the dataset and filter it by query and location"""
+        if self.session is None:
+            return []
+        
         try:
-            import requests
-            
-            params = {
-                'token': self.api_token,
-                'format': 'json'
-            }
+            with self.session.get(self.base_url, params=self.DATASET_PARAMS, stream=True, timeout=15) as response:
+                if response.status_code != 200:
+                    logger.warning("Apify API error: %s", response.status_code)
+                    return []
+                data = _read_json_body(response)
             
-            response = requests.get(self.base_url, params=params, timeout=15)
+            # Lowercase the filters once; an empty or blank filter includes all jobs
+            q = query.lower() if query and query.strip() else ''
+            loc = location.lower() if location and location.strip() else ''
             
-            if response.status_code == 200:
-                data = response.json()
-                jobs = []
-                
-                # Filter jobs based on query and location if provided
-                for item in data:
-                    title = item.get('title', '').lower()
-                    job_location = item.get('location', '').lower()
-                    company = item.get('companyName', '')
-                    
-                    # More lenient filtering logic - if no query, include all jobs
-                    query_match = True  # Default to include all
-                    if query and query.strip():  # Only filter if query is provided and not empty
-                        query_match = query.lower() in title or query.lower() in company.lower()
-                    
-                    location_match = True  # Default to include all
-                    if location and location.strip():  # Only filter if location is provided and not empty
-                        location_match = location.lower() in job_location
-                    
-                    if query_match and location_match:
-                        # Format salary
-                        salary = item.get('salary', 'Not specified')
-                        if not salary or salary.strip() == '':
-                            salary = 'Not specified'
-                        
-                        # Format description
-                        description = item.get('description', '')
-                        if len(description) > 300:
-                            description = description[:300] + "..."
-                        
-                        # Create JobPosting object
-                        job = JobPosting(
-                            title=item.get('title', 'Unknown Title'),
-                            company=company,
-                            location=item.get('location', 'Unknown Location'),
-                            description=description,
-                            url=item.get('jobUrl', item.get('applyUrl', '#')),
-                            salary_range=salary,
-                            posted_date=item.get('postedTime', 'Unknown'),
-                            source='apify-linkedin',
-                            job_type=item.get('contractType', 'Full-time'),
-                            work_type='unknown',
-                            skills_required=[]
-                        )
-                        jobs.append(job)
+            # Filter jobs based on query and location if provided, partitioning
+            # title matches ahead of company-only matches (stable, so no sort needed)
+            title_matches, company_matches = [], []
+            for item in data:
+                if loc and loc not in item.get('location', '').lower():
+                    continue
+                if not q or q in item.get('title', '').lower():
+                    title_matches.append(item)
+                    if len(title_matches) == 20:
+                        break  # The top 20 are all title matches
+                elif q in item.get('companyName', '').lower():
+                    company_matches.append(item)
+            matches = title_matches + company_matches
+            
+            # Only the top 20 matches are returned, so only they are formatted
+            jobs = []
+            for item in matches[:20]:
+                # Format salary
+                salary = item.get('salary')
+                if not salary or not salary.strip():
+                    salary = 'Not specified'
                 
-                # Sort by relevance (exact title matches first) if query provided
-                if query and query.strip():
-                    jobs.sort(key=lambda x: 0 if query.lower() in x.title.lower() else 1)
+                # Format description
+                description = item.get('description', '')
+                if len(description) > APIFY_DESCRIPTION_CHARS:
+                    description = description[:APIFY_DESCRIPTION_CHARS] + "..."
                 
-                return jobs[:20]  # Return top 20 matches
-            else:
-                print(f"Apify API error: {response.status_code}")
-                return []
+                # Create JobPosting object
+                job = JobPosting(
+                    title=item.get('title', 'Unknown Title'),
+                    company=item.get('companyName', ''),
+                    location=item.get('location', 'Unknown Location'),
+                    description=description,
+                    url=item.get('jobUrl', item.get('applyUrl', '#')),
+                    salary_range=salary,
+                    posted_date=item.get('postedTime', 'Unknown'),
+                    source='apify-linkedin',
+                    job_type=item.get('contractType', 'Full-time'),
+                    work_type='unknown',
+                    skills_required=()
+                )
+                jobs.append(job)
+            
+            return jobs
                 
         except Exception as e:
-            print(f"Apify API exception: {e}")
+            logger.warning("Apify API exception: %s", e)
             return []
 
 
+# Apify settings are read once per process and the clients shared by every JobAggregator
+APIFY_API_TOKEN = os.getenv('APIFY_API_TOKEN')
+APIFY_LINKEDIN_DATASET_ID = os.getenv('APIFY_LINKEDIN_DATASET_ID', '1bgPCIvQOdVi4gYbh')
+
+APIFY_LINKEDIN_CLIENT = ApifyJobClient(
+    dataset_id=APIFY_LINKEDIN_DATASET_ID,
+    api_token=APIFY_API_TOKEN
+)
+APIFY_INDEED_CLIENT = ApifyIndeedClient(
+    api_token=APIFY_API_TOKEN
+)
+
+
 if __name__ == "__main__":
     # Example usage
     aggregator = JobAggregator()
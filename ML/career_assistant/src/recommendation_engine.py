@@ -5,16 +5,86 @@ This module ranks jobs based on skill overlap, role relevance, and growth opport
 Provides comprehensive job recommendations with detailed scoring and explanations.
 """
 
+import heapq
 import math
-from typing import List, Dict, Tuple, Optional
+import re
+from typing import List, Dict, Tuple, Optional, FrozenSet, Callable, Hashable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+
+# Optional Aho-Corasick automaton for single-pass keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional JIT compiler for combining the score matrix
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from user_profile import UserProfile
-from job_scraper import JobPosting
+from job_scraper import JobPosting, DATACLASS_SLOTS
 from skill_matcher import SkillMatcher, SkillAnalysis
 
 
+# Columns of the per-job score matrix, in the same order as JobScore's fields
+SCORE_FACTORS = (
+    "skill_match",
+    "role_relevance",
+    "experience_match",
+    "growth_potential",
+    "location_match",
+    "salary_match",
+)
+
+# Column after the factors holding the weighted overall score, matching JobScore.overall_score
+OVERALL_COLUMN = len(SCORE_FACTORS)
+
+# Element type of the score matrix. Scores are surfaced as-is through JobScore,
+# and float32 would both perturb the reported values and reorder near-ties.
+SCORE_DTYPE = np.float64
+
+
+# Experience levels from least to most senior
+EXPERIENCE_LEVELS = ("entry", "mid", "senior", "executive")
+
+# Experience match score indexed by [user level][job level] in EXPERIENCE_LEVELS
+# order: one level down is fine (overqualified), one level up is a stretch,
+# two levels apart is a significant mismatch and three a poor match
+EXPERIENCE_SCORE_TABLE = (
+    (100, 70, 40, 20),   # entry
+    (85, 100, 70, 40),   # mid
+    (40, 85, 100, 70),   # senior
+    (20, 40, 85, 100),   # executive
+)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _weighted_sum(scores, weights):
+        """Row-wise weighted sum of the leading columns of a score matrix in one compiled pass.
+        
+        Each row is accumulated left to right (no fastmath), so results round
+        exactly like the column-by-column numpy version.
+        """
+        n_rows = scores.shape[0]
+        n_factors = weights.shape[0]
+        overall_scores = np.empty(n_rows, dtype=scores.dtype)
+        for i in range(n_rows):
+            total = scores[i, 0] * weights[0]
+            for j in range(1, n_factors):
+                total += scores[i, j] * weights[j]
+            overall_scores[i] = total
+        return overall_scores
+
+
 class GrowthFactor(Enum):
     """Growth factors for different industries and roles."""
     HIGH = 1.3      # AI/ML, Cloud, Cybersecurity
@@ -23,7 +93,64 @@ class GrowthFactor(Enum):
     DECLINING = 0.8 # Legacy technologies
 
 
-@dataclass
+# Growth score awarded when a job mentions a keyword of the given factor
+GROWTH_FACTOR_SCORES = {
+    GrowthFactor.HIGH: 95,
+    GrowthFactor.MEDIUM: 75,
+    GrowthFactor.DECLINING: 30,
+}
+
+
+# Match quality by overall score in buckets of 5 points: below 50 developing,
+# then fair from 50, good from 65, very good from 75 and excellent from 85
+MATCH_QUALITY_BUCKET = 5
+MATCH_QUALITY_BY_BUCKET = (
+    ("developing",) * 10
+    + ("fair",) * 3
+    + ("good",) * 2
+    + ("very good",) * 2
+    + ("excellent",) * 4
+)
+
+
+# Dollar amounts such as "$120,000" or "95,000.00" in a salary range
+SALARY_AMOUNT_PATTERN = re.compile(r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+
+@lru_cache(maxsize=1024)
+def parse_salary_range(salary_range: str) -> Optional[Tuple[int, int]]:
+    """Parse the (min, max) amounts of a salary range, or None if it can't be parsed."""
+    salary_numbers = SALARY_AMOUNT_PATTERN.findall(salary_range)
+    if len(salary_numbers) < 2:
+        return None
+    
+    try:
+        return int(salary_numbers[0].replace(',', '')), int(salary_numbers[1].replace(',', ''))
+    except ValueError:
+        return None
+
+
+def top_k_indices(scores: np.ndarray, top_k: Optional[int]) -> List[int]:
+    """Indices of the top_k highest scores, best first.
+    
+    Selects with an O(N) partition and sorts only the winners. Equal scores
+    keep their input order, exactly like a stable descending sort sliced to top_k.
+    """
+    n = len(scores)
+    if top_k is None or not 0 <= top_k < n:
+        return np.argsort(-scores, kind="stable")[:top_k].tolist()
+    if top_k == 0:
+        return []
+    
+    # Everything above the k-th largest score wins; ties at that score are taken in input order
+    kth_score = np.partition(scores, n - top_k)[n - top_k]
+    above = np.flatnonzero(scores > kth_score)
+    ties = np.flatnonzero(scores == kth_score)[:top_k - len(above)]
+    chosen = np.sort(np.concatenate((above, ties)))
+    return chosen[np.argsort(-scores[chosen], kind="stable")].tolist()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class JobScore:
     """Comprehensive scoring for a job recommendation."""
     
@@ -48,7 +175,7 @@ class JobScore:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JobRecommendation:
     """A job recommendation with scoring and explanation."""
     
@@ -74,6 +201,18 @@ class JobRecommendation:
         }
 
 
+@dataclass
+class _UserContext:
+    """User profile fields normalized once per recommendation run."""
+    
+    preferred_roles: Tuple[Tuple[str, FrozenSet[str], int], ...]  # (lowercased role, its words, word count)
+    level: str                                    # Lowercased experience level
+    level_pattern: Optional[re.Pattern]           # Keywords of the user's level
+    level_index: Optional[int]                    # Position in EXPERIENCE_LEVELS
+    location: Optional[Tuple[str, str, Optional[str]]]  # Prepared location, if any
+    salary_range: Optional[Tuple[int, int]]       # (min, max), if any
+
+
 class JobRecommendationEngine:
     """Advanced job recommendation engine with multiple ranking factors."""
     
@@ -116,6 +255,56 @@ class JobRecommendationEngine:
             "senior": ["senior", "lead", "principal", "architect", "manager"],
             "executive": ["director", "vp", "chief", "head", "executive"]
         }
+        
+        # Each level's keywords folded into one pattern, so matching a job's level
+        # is a single scan instead of a loop of substring checks
+        self._experience_patterns = {
+            level: re.compile("|".join(map(re.escape, keywords)))
+            for level, keywords in self.experience_mapping.items()
+        }
+        
+        # Position of each level in the experience progression
+        self._level_index = {level: index for index, level in enumerate(EXPERIENCE_LEVELS)}
+        
+        # Growth keywords flattened to (keyword, score) pairs in priority order
+        self._growth_keyword_scores = tuple(
+            (keyword, GROWTH_FACTOR_SCORES[growth_factor])
+            for growth_factor, keywords in self.growth_keywords.items()
+            for keyword in keywords
+        )
+        
+        # All growth keywords compiled into one automaton so each job text is scanned once
+        self._growth_automaton = self._build_growth_automaton() if AHOCORASICK_AVAILABLE else None
+    
+    def _build_growth_automaton(self):
+        """Compile growth_keywords into an automaton mapping keyword -> (priority, factor)."""
+        automaton = ahocorasick.Automaton()
+        # Earlier factors take priority, as in the keyword scan
+        for priority, (growth_factor, keywords) in enumerate(self.growth_keywords.items()):
+            for keyword in keywords:
+                if keyword not in automaton:
+                    automaton.add_word(keyword, (priority, growth_factor))
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_user_context(self, user_profile: UserProfile) -> _UserContext:
+        """Normalize the user's side of every score once, ahead of scoring many jobs."""
+        level = user_profile.experience_level.lower()
+        return _UserContext(
+            preferred_roles=tuple(
+                (role_lower, role_words, len(role_words))
+                for role_lower in (role.lower() for role in user_profile.preferred_roles)
+                for role_words in (frozenset(role_lower.split()),)
+            ),
+            level=level,
+            level_pattern=self._experience_patterns.get(level),
+            level_index=self._level_index.get(level),
+            location=self._prepare_user_location(user_profile.location) if user_profile.location else None,
+            salary_range=(
+                (user_profile.salary_range["min"], user_profile.salary_range["max"])
+                if user_profile.salary_range else None
+            ),
+        )
     
     def calculate_skill_score(self, user_profile: UserProfile, job: JobPosting) -> Tuple[float, SkillAnalysis]:
         """Calculate skill overlap score between user and job."""
@@ -135,12 +324,24 @@ class JobRecommendationEngine:
     
     def calculate_role_relevance_score(self, user_profile: UserProfile, job: JobPosting) -> float:
         """Calculate how well the job role matches user preferences."""
-        job_title_lower = job.title.lower()
+        return self._role_relevance_score(self._build_user_context(user_profile), job.title)
+    
+    def _role_relevance_scores(self, user: _UserContext, jobs: List[JobPosting]) -> List[float]:
+        """Role relevance scores for many jobs, scoring each distinct title once."""
+        if not user.preferred_roles:
+            return [0] * len(jobs)
+        
+        return self._scores_by_key(jobs, lambda job: job.title, lambda title: self._role_relevance_score(user, title))
+    
+    @staticmethod
+    def _role_relevance_score(user: _UserContext, job_title: str) -> float:
+        """Role relevance of a job title against a prepared user context."""
+        job_title_lower = job_title.lower()
+        title_words = None  # Split on first partial match, then shared by every role
         score = 0.0
         max_score = 0.0
         
-        for preferred_role in user_profile.preferred_roles:
-            role_lower = preferred_role.lower()
+        for role_lower, role_words, role_word_count in user.preferred_roles:
             max_score += 100
             
             # Exact match
@@ -149,72 +350,62 @@ class JobRecommendationEngine:
             # Partial match
             else:
                 # Check for keyword overlap
-                role_words = set(role_lower.split())
-                title_words = set(job_title_lower.split())
-                overlap = len(role_words.intersection(title_words))
+                if title_words is None:
+                    title_words = frozenset(job_title_lower.split())
+                overlap = len(role_words & title_words)
                 if overlap > 0:
-                    partial_score = (overlap / len(role_words)) * 80
+                    partial_score = (overlap / role_word_count) * 80
                     score += partial_score
         
         return (score / max_score * 100) if max_score > 0 else 0
     
     def calculate_experience_match_score(self, user_profile: UserProfile, job: JobPosting) -> float:
         """Calculate experience level compatibility."""
-        if not job.experience_level:
+        return self._experience_match_score(self._build_user_context(user_profile), job.experience_level)
+    
+    def _experience_match_score(self, user: _UserContext, experience_level: Optional[str]) -> float:
+        """Experience compatibility of a job's level against a prepared user context."""
+        if not experience_level:
             return 75  # Neutral score if not specified
         
-        user_level = user_profile.experience_level.lower()
-        job_level = job.experience_level.lower()
+        job_level = experience_level.lower()
         
         # Direct match
-        if user_level == job_level:
+        if user.level == job_level:
             return 100
         
         # Check if user level keywords appear in job level
-        user_keywords = self.experience_mapping.get(user_level, [])
-        for keyword in user_keywords:
-            if keyword in job_level:
-                return 90
+        if user.level_pattern is not None and user.level_pattern.search(job_level):
+            return 90
         
         # Experience progression logic
-        level_hierarchy = ["entry", "mid", "senior", "executive"]
-        
-        try:
-            user_index = level_hierarchy.index(user_level)
-            job_index = level_hierarchy.index(job_level)
-            
-            difference = abs(user_index - job_index)
-            
-            if difference == 0:
-                return 100
-            elif difference == 1:
-                # One level difference - still good
-                if user_index > job_index:
-                    return 85  # Overqualified but okay
-                else:
-                    return 70  # Stretch opportunity
-            elif difference == 2:
-                return 40  # Significant mismatch
-            else:
-                return 20  # Poor match
-                
-        except ValueError:
+        user_index = user.level_index
+        job_index = self._level_index.get(job_level)
+        if user_index is None or job_index is None:
             return 50  # Unknown levels, neutral score
+        
+        return EXPERIENCE_SCORE_TABLE[user_index][job_index]
     
     def calculate_growth_score(self, job: JobPosting) -> float:
         """Calculate growth potential based on industry and technologies."""
-        job_text = f"{job.title} {job.description}".lower()
-        
-        # Check for growth factor keywords
-        for growth_factor, keywords in self.growth_keywords.items():
-            for keyword in keywords:
-                if keyword in job_text:
-                    if growth_factor == GrowthFactor.HIGH:
-                        return 95
-                    elif growth_factor == GrowthFactor.MEDIUM:
-                        return 75
-                    elif growth_factor == GrowthFactor.DECLINING:
-                        return 30
+        return self._growth_text_score(f"{job.title} {job.description}".lower())
+    
+    def _growth_text_score(self, job_text: str) -> float:
+        """Growth potential of a job's lowercased title and description."""
+        # Single pass over the text, keeping the highest-priority factor hit
+        if self._growth_automaton is not None:
+            best = None
+            for _, hit in self._growth_automaton.iter(job_text):
+                if best is None or hit[0] < best[0]:
+                    best = hit
+                    if hit[0] == 0:
+                        break  # Top-priority factor, nothing can outrank it
+            return GROWTH_FACTOR_SCORES[best[1]] if best else 60
+        
+        # Check for growth factor keywords, highest priority first
+        for keyword, growth_score in self._growth_keyword_scores:
+            if keyword in job_text:
+                return growth_score
         
         # Default score if no specific keywords found
         return 60
@@ -224,8 +415,47 @@ class JobRecommendationEngine:
         if not user_profile.location or not job.location:
             return 75  # Neutral if not specified
         
-        user_location = user_profile.location.lower()
-        job_location = job.location.lower()
+        return self._location_match_score(self._prepare_user_location(user_profile.location), job.location)
+    
+    def _location_scores(self, user: _UserContext, jobs: List[JobPosting]) -> List[float]:
+        """Location scores for many jobs, scoring each distinct job location once."""
+        user_location = user.location
+        if user_location is None:
+            return [75] * len(jobs)  # Neutral if not specified
+        
+        return self._scores_by_key(
+            jobs, lambda job: job.location,
+            lambda location: self._location_match_score(user_location, location) if location else 75
+        )
+    
+    @staticmethod
+    def _scores_by_key(jobs: List[JobPosting], key: Callable[[JobPosting], Hashable],
+                       score: Callable[[Hashable], float]) -> List[float]:
+        """Score jobs by score(key(job)), lowercasing and scoring each distinct key only once."""
+        scores_by_key = {}
+        scores = []
+        for job in jobs:
+            job_key = key(job)
+            job_score = scores_by_key.get(job_key)
+            if job_score is None:
+                job_score = score(job_key)
+                scores_by_key[job_key] = job_score
+            scores.append(job_score)
+        return scores
+    
+    @staticmethod
+    def _prepare_user_location(location: str) -> Tuple[str, str, Optional[str]]:
+        """Lowercase the user's location and split out its city and, if present, state/region."""
+        user_location = location.lower()
+        user_parts = user_location.split(",")
+        region = user_parts[-1].strip() if len(user_parts) > 1 else None
+        return user_location, user_parts[0].strip(), region
+    
+    @staticmethod
+    def _location_match_score(user: Tuple[str, str, Optional[str]], job_location: str) -> float:
+        """Score a non-empty job location against a prepared user location."""
+        user_location, user_city, user_region = user
+        job_location = job_location.lower()
         
         # Handle remote work
         if "remote" in job_location:
@@ -236,59 +466,51 @@ class JobRecommendationEngine:
             return 100
         
         # Same city
-        user_parts = user_location.split(",")
         job_parts = job_location.split(",")
-        
-        if len(user_parts) > 0 and len(job_parts) > 0:
-            if user_parts[0].strip() == job_parts[0].strip():
-                return 90
+        if user_city == job_parts[0].strip():
+            return 90
         
         # Same state/region
-        if len(user_parts) > 1 and len(job_parts) > 1:
-            if user_parts[-1].strip() == job_parts[-1].strip():
+        if user_region is not None and len(job_parts) > 1:
+            if user_region == job_parts[-1].strip():
                 return 60
         
         return 30  # Different locations
     
     def calculate_salary_score(self, user_profile: UserProfile, job: JobPosting) -> float:
         """Calculate salary compatibility score."""
-        if not user_profile.salary_range or not job.salary_range:
+        return self._salary_score(self._build_user_context(user_profile), job.salary_range)
+    
+    def _salary_score(self, user: _UserContext, salary_range: Optional[str]) -> float:
+        """Salary compatibility of a job's salary range against a prepared user context."""
+        if user.salary_range is None or not salary_range:
             return 75  # Neutral if not specified
         
         # Extract salary numbers from job posting
-        import re
-        salary_numbers = re.findall(r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', job.salary_range)
-        
-        if len(salary_numbers) < 2:
+        job_salary = parse_salary_range(salary_range)
+        if job_salary is None:
             return 75  # Can't parse salary
         
-        try:
-            job_min = int(salary_numbers[0].replace(',', ''))
-            job_max = int(salary_numbers[1].replace(',', ''))
-            
-            user_min = user_profile.salary_range["min"]
-            user_max = user_profile.salary_range["max"]
+        job_min, job_max = job_salary
+        user_min, user_max = user.salary_range
+        
+        # Check for overlap
+        if job_max >= user_min and job_min <= user_max:
+            # Calculate overlap percentage
+            overlap_start = max(job_min, user_min)
+            overlap_end = min(job_max, user_max)
+            overlap_size = overlap_end - overlap_start
             
-            # Check for overlap
-            if job_max >= user_min and job_min <= user_max:
-                # Calculate overlap percentage
-                overlap_start = max(job_min, user_min)
-                overlap_end = min(job_max, user_max)
-                overlap_size = overlap_end - overlap_start
-                
-                user_range_size = user_max - user_min
-                overlap_percentage = overlap_size / user_range_size
-                
-                return min(80 + (overlap_percentage * 20), 100)
+            user_range_size = user_max - user_min
+            overlap_percentage = overlap_size / user_range_size
             
-            # No overlap
-            if job_max < user_min:
-                return 20  # Too low
-            else:
-                return 40  # Too high (but might be negotiable)
-                
-        except (ValueError, IndexError):
-            return 75  # Parsing error, neutral score
+            return min(80 + (overlap_percentage * 20), 100)
+        
+        # No overlap
+        if job_max < user_min:
+            return 20  # Too low
+        else:
+            return 40  # Too high (but might be negotiable)
     
     def generate_job_explanation(self, recommendation: JobRecommendation) -> str:
         """Generate a detailed explanation for the job recommendation."""
@@ -337,16 +559,8 @@ class JobRecommendationEngine:
     
     def _get_match_quality(self, score: float) -> str:
         """Get qualitative description of match quality."""
-        if score >= 85:
-            return "excellent"
-        elif score >= 75:
-            return "very good"
-        elif score >= 65:
-            return "good"
-        elif score >= 50:
-            return "fair"
-        else:
-            return "developing"
+        bucket = int(score) // MATCH_QUALITY_BUCKET
+        return MATCH_QUALITY_BY_BUCKET[min(max(bucket, 0), len(MATCH_QUALITY_BY_BUCKET) - 1)]
     
     def generate_pros_and_cons(self, job: JobPosting, score: JobScore, analysis: SkillAnalysis) -> Tuple[List[str], List[str]]:
         """Generate pros and cons for the job."""
@@ -392,45 +606,115 @@ class JobRecommendationEngine:
         
         return pros, cons
     
+    def score_jobs(self, user_profile: UserProfile, jobs: List[JobPosting],
+                   top_k: Optional[int] = None) -> Tuple[np.ndarray, List[Optional[SkillAnalysis]]]:
+        """Score every job on each ranking factor.
+        
+        Returns an (N, 7) matrix laid out like JobScore, with one column per
+        SCORE_FACTORS entry followed by the weighted overall score in
+        OVERALL_COLUMN, plus the skill analysis behind each job's skill score.
+        
+        Skill analysis is by far the most expensive factor. When top_k is
+        given, it is skipped for jobs that cannot reach the top k even with a
+        perfect skill score; those jobs get a skill score of 0 and no analysis.
+        """
+        scores = np.empty((len(jobs), OVERALL_COLUMN + 1), dtype=SCORE_DTYPE)
+        user = self._build_user_context(user_profile)
+        
+        scores[:, 1] = self._role_relevance_scores(user, jobs)
+        scores[:, 2] = self._scores_by_key(
+            jobs, lambda job: job.experience_level, lambda level: self._experience_match_score(user, level)
+        )
+        scores[:, 3] = self._scores_by_key(
+            jobs, lambda job: (job.title, job.description),
+            lambda text: self._growth_text_score(f"{text[0]} {text[1]}".lower())
+        )
+        scores[:, 4] = self._location_scores(user, jobs)
+        scores[:, 5] = self._scores_by_key(
+            jobs, lambda job: job.salary_range, lambda salary_range: self._salary_score(user, salary_range)
+        )
+        
+        # Best overall score each job could reach, i.e. with a perfect skill score
+        prune = top_k is not None and 0 < top_k < len(jobs)
+        if prune:
+            scores[:, 0] = 100
+            upper_bounds = self.combine_scores(scores)
+            order = np.argsort(-upper_bounds, kind="stable").tolist()
+            weights = [self.weights[factor] for factor in SCORE_FACTORS]
+            best_scores = []  # Min-heap of the top_k overall scores found so far
+        else:
+            order = range(len(jobs))
+        
+        scores[:, 0] = 0
+        skill_analyses = [None] * len(jobs)
+        
+        # Postings with the same required skills share one skill analysis
+        skill_results_by_skills = {}
+        for i in order:
+            if prune and len(best_scores) == top_k and upper_bounds[i] < best_scores[0]:
+                break  # Neither this job nor any after it can make the top k
+            
+            job = jobs[i]
+            required_skills = tuple(job.skills_required)
+            skill_result = skill_results_by_skills.get(required_skills)
+            if skill_result is None:
+                skill_result = self.calculate_skill_score(user_profile, job)
+                skill_results_by_skills[required_skills] = skill_result
+            scores[i, 0], skill_analyses[i] = skill_result
+            
+            if prune:
+                # Same left-to-right accumulation as combine_scores
+                overall_score = scores[i, 0] * weights[0]
+                for column in range(1, len(weights)):
+                    overall_score += scores[i, column] * weights[column]
+                if len(best_scores) < top_k:
+                    heapq.heappush(best_scores, overall_score)
+                else:
+                    heapq.heappushpop(best_scores, overall_score)
+        
+        scores[:, OVERALL_COLUMN] = self.combine_scores(scores)
+        return scores, skill_analyses
+    
+    def combine_scores(self, scores: np.ndarray) -> np.ndarray:
+        """Weight the SCORE_FACTORS columns of a score matrix into N overall scores.
+        
+        Columns are accumulated left to right, matching the rounding of the
+        scalar weighted sum so jobs with equal scores keep their relative order.
+        """
+        weights = [self.weights[factor] for factor in SCORE_FACTORS]
+        if NUMBA_AVAILABLE:
+            return _weighted_sum(scores, np.array(weights, dtype=scores.dtype))
+        
+        overall_scores = scores[:, 0] * weights[0]
+        for column in range(1, len(weights)):
+            overall_scores += scores[:, column] * weights[column]
+        return overall_scores
+    
     def recommend_jobs(self, user_profile: UserProfile, jobs: List[JobPosting], top_k: int = 5) -> List[JobRecommendation]:
         """Generate top-k job recommendations with detailed analysis."""
         recommendations = []
         
         print(f"🤖 Analyzing {len(jobs)} jobs for recommendations...")
         
-        for job in jobs:
-            # Calculate all scores
-            skill_score, skill_analysis = self.calculate_skill_score(user_profile, job)
-            role_score = self.calculate_role_relevance_score(user_profile, job)
-            experience_score = self.calculate_experience_match_score(user_profile, job)
-            growth_score = self.calculate_growth_score(job)
-            location_score = self.calculate_location_score(user_profile, job)
-            salary_score = self.calculate_salary_score(user_profile, job)
-            
-            # Calculate weighted overall score
-            overall_score = (
-                skill_score * self.weights["skill_match"] +
-                role_score * self.weights["role_relevance"] +
-                experience_score * self.weights["experience_match"] +
-                growth_score * self.weights["growth_potential"] +
-                location_score * self.weights["location_match"] +
-                salary_score * self.weights["salary_match"]
-            )
+        # Score all jobs column by column, with the weighted overall score in the last column
+        scores, skill_analyses = self.score_jobs(user_profile, jobs, top_k)
+        
+        # Explanations, pros/cons and learning suggestions are only built for the
+        # top-k jobs, best first, since the rest are never returned
+        suggestions_by_gaps = {}
+        for i in top_k_indices(scores[:, OVERALL_COLUMN], top_k):
+            job = jobs[i]
+            skill_analysis = skill_analyses[i]
+            job_score = JobScore(*scores[i].tolist())
             
-            job_score = JobScore(
-                skill_score=skill_score,
-                role_relevance_score=role_score,
-                experience_match_score=experience_score,
-                growth_score=growth_score,
-                location_score=location_score,
-                salary_score=salary_score,
-                overall_score=overall_score
-            )
-            
-            # Generate learning suggestions
-            learning_suggestions = self.skill_matcher.get_skill_improvement_suggestions(
-                skill_analysis.missing_skills
-            )
+            # Generate learning suggestions, once per distinct set of skill gaps
+            skill_gaps = tuple(skill_analysis.missing_skills)
+            learning_suggestions = suggestions_by_gaps.get(skill_gaps)
+            if learning_suggestions is None:
+                learning_suggestions = self.skill_matcher.get_skill_improvement_suggestions(
+                    skill_analysis.missing_skills
+                )
+                suggestions_by_gaps[skill_gaps] = learning_suggestions
             
             # Create recommendation
             recommendation = JobRecommendation(
@@ -452,11 +736,8 @@ class JobRecommendationEngine:
             
             recommendations.append(recommendation)
         
-        # Sort by overall score and return top-k
-        recommendations.sort(key=lambda x: x.score.overall_score, reverse=True)
-        
         print(f"✅ Generated {len(recommendations)} recommendations")
-        return recommendations[:top_k]
+        return recommendations
 
 
 def demonstrate_recommendations():
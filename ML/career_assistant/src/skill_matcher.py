@@ -5,15 +5,127 @@ This module calculates skill overlap and compatibility between user profiles and
 Uses advanced text processing and fuzzy matching for accurate skill comparison.
 """
 
+import heapq
 import re
-from typing import List, Dict, Set, Tuple
+import sys
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
 from dataclasses import dataclass
 from collections import Counter
+from functools import lru_cache, cached_property
+from operator import itemgetter
 import difflib
 import math
 
+# Optional C++ string similarity, used to rule out dissimilar skill pairs cheaply
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
-@dataclass
+# Optional JIT compiler for the same pre-check when RapidFuzz is missing
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Characters dropped when normalizing a skill name
+SKILL_PUNCTUATION_PATTERN = re.compile(r'[^\w\s+#.]')
+
+# Common abbreviations expanded when normalizing a skill name
+SKILL_ABBREVIATIONS = {
+    "js": "javascript",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+}
+SKILL_ABBREVIATION_PATTERN = re.compile(r'\b(?:' + '|'.join(SKILL_ABBREVIATIONS) + r')\b')
+
+
+def _expand_abbreviation(match: re.Match) -> str:
+    """Replacement for an abbreviation matched by SKILL_ABBREVIATION_PATTERN."""
+    return SKILL_ABBREVIATIONS[match.group(0)]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _lcs_ratio_matrix(user_chars, user_offsets, job_chars, job_offsets, threshold):
+        """Longest-common-subsequence ratio of every user/job skill pair, 0 where below threshold.
+        
+        Skills are code points packed end to end; skill ``i`` spans
+        ``offsets[i]:offsets[i + 1]``. The ratio 2 * LCS / (len_a + len_b) is
+        never below difflib's ratio for the same pair.
+        """
+        n_users = user_offsets.shape[0] - 1
+        n_jobs = job_offsets.shape[0] - 1
+        ratios = np.zeros((n_users, n_jobs))
+        
+        max_job_length = 0
+        for j in range(n_jobs):
+            max_job_length = max(max_job_length, job_offsets[j + 1] - job_offsets[j])
+        row = np.empty(max_job_length + 1, dtype=np.int64)
+        
+        for i in range(n_users):
+            a_start = user_offsets[i]
+            a_length = user_offsets[i + 1] - a_start
+            for j in range(n_jobs):
+                b_start = job_offsets[j]
+                b_length = job_offsets[j + 1] - b_start
+                total = a_length + b_length
+                if total == 0:
+                    ratios[i, j] = 1.0
+                    continue
+                # The LCS can't be longer than the shorter skill
+                if 2.0 * min(a_length, b_length) / total < threshold:
+                    continue
+                
+                row[:b_length + 1] = 0
+                for x in range(a_length):
+                    char = user_chars[a_start + x]
+                    diagonal = 0
+                    for y in range(b_length):
+                        above = row[y + 1]
+                        if char == job_chars[b_start + y]:
+                            row[y + 1] = diagonal + 1
+                        elif row[y] > above:
+                            row[y + 1] = row[y]
+                        diagonal = above
+                
+                ratio = 2.0 * row[b_length] / total
+                if ratio >= threshold:
+                    ratios[i, j] = ratio
+        
+        return ratios
+
+
+def _pack_code_points(strings: List[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Pack strings end to end as code points, with the offsets delimiting each one."""
+    chars = np.frombuffer("".join(strings).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(string) for string in strings], out=offsets[1:])
+    return chars, offsets
+
+
+@lru_cache(maxsize=4096)
+def _normalize_skill(skill: str) -> str:
+    """Normalize a skill name, memoized since the same skills recur across analyses."""
+    # Convert to lowercase and remove special characters
+    normalized = SKILL_PUNCTUATION_PATTERN.sub('', skill.lower().strip())
+    
+    # Handle common variations, all in one pass since no expansion creates another abbreviation
+    normalized = SKILL_ABBREVIATION_PATTERN.sub(_expand_abbreviation, normalized)
+    
+    # Interned like the skill tables, so lookups can compare by identity
+    return sys.intern(normalized)
+
+
+# Slotted dataclasses (Python 3.10+) for the many match objects built per analysis
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SkillMatch:
     """Represents a skill match between user and job requirements."""
     
@@ -23,7 +135,7 @@ class SkillMatch:
     match_type: str     # "exact", "fuzzy", "synonym", "related"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SkillAnalysis:
     """Comprehensive analysis of skill compatibility."""
     
@@ -36,123 +148,167 @@ class SkillAnalysis:
     total_user_skills: int
 
 
+def _intern_skill_sets(table: Dict[str, Set[str]]) -> Dict[str, FrozenSet[str]]:
+    """Freeze a table of skill sets, interning every skill for fast hashing and comparison."""
+    return {sys.intern(key): frozenset(map(sys.intern, skills)) for key, skills in table.items()}
+
+
+# Skill synonyms for better matching, keyed by main skill
+SKILL_SYNONYMS = {
+    # Programming languages
+    "javascript": {"js", "ecmascript", "node.js", "nodejs"},
+    "python": {"py", "python3", "python2"},
+    "c++": {"cpp", "c plus plus", "cplusplus"},
+    "c#": {"csharp", "c sharp", ".net", "dotnet"},
+    
+    # Databases
+    "postgresql": {"postgres", "psql"},
+    "mysql": {"my sql"},
+    "mongodb": {"mongo", "nosql"},
+    "sql": {"structured query language", "database"},
+    
+    # Web technologies
+    "react": {"reactjs", "react.js"},
+    "angular": {"angularjs", "angular.js"},
+    "vue": {"vuejs", "vue.js"},
+    "node.js": {"nodejs", "node", "javascript"},
+    
+    # Cloud platforms
+    "aws": {"amazon web services", "amazon aws"},
+    "gcp": {"google cloud platform", "google cloud"},
+    "azure": {"microsoft azure"},
+    
+    # Data science
+    "machine learning": {"ml", "artificial intelligence", "ai"},
+    "data science": {"data analysis", "analytics"},
+    "pandas": {"python pandas"},
+    "scikit-learn": {"sklearn", "scikit learn"},
+    "tensorflow": {"tf"},
+    "pytorch": {"torch"},
+    
+    # Tools
+    "git": {"version control", "github", "gitlab"},
+    "docker": {"containerization", "containers"},
+    "kubernetes": {"k8s", "container orchestration"},
+    
+    # Methodologies
+    "agile": {"scrum", "kanban"},
+    "devops": {"ci/cd", "continuous integration"},
+}
+
+
+# Skill categories for related skill matching
+SKILL_CATEGORIES = _intern_skill_sets({
+    "programming": {
+        "python", "java", "javascript", "typescript", "c++", "c#", "ruby", 
+        "php", "go", "rust", "swift", "kotlin", "scala", "r"
+    },
+    "web_frontend": {
+        "html", "css", "javascript", "react", "angular", "vue", "jquery",
+        "bootstrap", "sass", "less", "webpack", "babel"
+    },
+    "web_backend": {
+        "node.js", "express", "django", "flask", "spring", "laravel",
+        "ruby on rails", "asp.net", "php", "python", "java"
+    },
+    "databases": {
+        "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
+        "cassandra", "oracle", "sqlite", "dynamodb"
+    },
+    "cloud": {
+        "aws", "azure", "gcp", "docker", "kubernetes", "terraform",
+        "ansible", "jenkins", "ci/cd"
+    },
+    "data_science": {
+        "python", "r", "sql", "pandas", "numpy", "scikit-learn",
+        "tensorflow", "pytorch", "jupyter", "matplotlib", "seaborn"
+    },
+    "machine_learning": {
+        "machine learning", "deep learning", "neural networks", "tensorflow",
+        "pytorch", "scikit-learn", "keras", "opencv", "nlp"
+    },
+    "mobile": {
+        "ios", "android", "swift", "kotlin", "react native", "flutter",
+        "xamarin", "cordova", "ionic"
+    }
+})
+
+
+def _expand_skill_synonyms(synonyms: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Expand main skill -> synonyms into a bidirectional synonym mapping."""
+    expanded_synonyms = {}
+    for main_skill, synonyms_set in synonyms.items():
+        expanded_synonyms[main_skill] = synonyms_set.copy()
+        for synonym in synonyms_set:
+            if synonym not in expanded_synonyms:
+                expanded_synonyms[synonym] = set()
+            expanded_synonyms[synonym].add(main_skill)
+            expanded_synonyms[synonym].update(synonyms_set - {synonym})
+    
+    return expanded_synonyms
+
+
+def _index_skill_categories(skill_categories: Dict[str, FrozenSet[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Invert skill categories into skill -> names of the categories containing it, in category order."""
+    skill_to_categories = {}
+    for category, skills in skill_categories.items():
+        for skill in skills:
+            skill_to_categories[skill] = skill_to_categories.get(skill, ()) + (category,)
+    return skill_to_categories
+
+
+@lru_cache(maxsize=None)
+def _expanded_skill_synonyms() -> Dict[str, FrozenSet[str]]:
+    """Bidirectional synonym mapping, built on first use and shared by every matcher."""
+    return _intern_skill_sets(_expand_skill_synonyms(SKILL_SYNONYMS))
+
+
+@lru_cache(maxsize=None)
+def _skill_category_index() -> Dict[str, Tuple[str, ...]]:
+    """Skill -> category names for SKILL_CATEGORIES, built on first use and shared by every matcher."""
+    return _index_skill_categories(SKILL_CATEGORIES)
+
+
 class SkillMatcher:
     """Advanced skill matching engine with fuzzy matching and synonym detection."""
     
     def __init__(self):
-        self.skill_synonyms = self._load_skill_synonyms()
-        self.skill_categories = self._load_skill_categories()
         self.fuzzy_threshold = 0.8  # Minimum similarity for fuzzy matching
     
-    def _load_skill_synonyms(self) -> Dict[str, Set[str]]:
+    # The tables are loaded on first use, so a matcher that only normalizes
+    # skills never builds them
+    @cached_property
+    def skill_synonyms(self) -> Dict[str, FrozenSet[str]]:
+        return self._load_skill_synonyms()
+    
+    @cached_property
+    def skill_categories(self) -> Dict[str, FrozenSet[str]]:
+        return self._load_skill_categories()
+    
+    @cached_property
+    def _skill_to_categories(self) -> Dict[str, Tuple[str, ...]]:
+        if self.skill_categories is SKILL_CATEGORIES:
+            return _skill_category_index()
+        return _index_skill_categories(self.skill_categories)
+    
+    def _load_skill_synonyms(self) -> Dict[str, FrozenSet[str]]:
         """Load skill synonyms for better matching."""
-        synonyms = {
-            # Programming languages
-            "javascript": {"js", "ecmascript", "node.js", "nodejs"},
-            "python": {"py", "python3", "python2"},
-            "c++": {"cpp", "c plus plus", "cplusplus"},
-            "c#": {"csharp", "c sharp", ".net", "dotnet"},
-            
-            # Databases
-            "postgresql": {"postgres", "psql"},
-            "mysql": {"my sql"},
-            "mongodb": {"mongo", "nosql"},
-            "sql": {"structured query language", "database"},
-            
-            # Web technologies
-            "react": {"reactjs", "react.js"},
-            "angular": {"angularjs", "angular.js"},
-            "vue": {"vuejs", "vue.js"},
-            "node.js": {"nodejs", "node", "javascript"},
-            
-            # Cloud platforms
-            "aws": {"amazon web services", "amazon aws"},
-            "gcp": {"google cloud platform", "google cloud"},
-            "azure": {"microsoft azure"},
-            
-            # Data science
-            "machine learning": {"ml", "artificial intelligence", "ai"},
-            "data science": {"data analysis", "analytics"},
-            "pandas": {"python pandas"},
-            "scikit-learn": {"sklearn", "scikit learn"},
-            "tensorflow": {"tf"},
-            "pytorch": {"torch"},
-            
-            # Tools
-            "git": {"version control", "github", "gitlab"},
-            "docker": {"containerization", "containers"},
-            "kubernetes": {"k8s", "container orchestration"},
-            
-            # Methodologies
-            "agile": {"scrum", "kanban"},
-            "devops": {"ci/cd", "continuous integration"},
-        }
-        
-        # Create bidirectional mapping
-        expanded_synonyms = {}
-        for main_skill, synonyms_set in synonyms.items():
-            expanded_synonyms[main_skill] = synonyms_set.copy()
-            for synonym in synonyms_set:
-                if synonym not in expanded_synonyms:
-                    expanded_synonyms[synonym] = set()
-                expanded_synonyms[synonym].add(main_skill)
-                expanded_synonyms[synonym].update(synonyms_set - {synonym})
-        
-        return expanded_synonyms
+        return _expanded_skill_synonyms()
     
-    def _load_skill_categories(self) -> Dict[str, Set[str]]:
+    def _load_skill_categories(self) -> Dict[str, FrozenSet[str]]:
         """Load skill categories for related skill matching."""
-        categories = {
-            "programming": {
-                "python", "java", "javascript", "typescript", "c++", "c#", "ruby", 
-                "php", "go", "rust", "swift", "kotlin", "scala", "r"
-            },
-            "web_frontend": {
-                "html", "css", "javascript", "react", "angular", "vue", "jquery",
-                "bootstrap", "sass", "less", "webpack", "babel"
-            },
-            "web_backend": {
-                "node.js", "express", "django", "flask", "spring", "laravel",
-                "ruby on rails", "asp.net", "php", "python", "java"
-            },
-            "databases": {
-                "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
-                "cassandra", "oracle", "sqlite", "dynamodb"
-            },
-            "cloud": {
-                "aws", "azure", "gcp", "docker", "kubernetes", "terraform",
-                "ansible", "jenkins", "ci/cd"
-            },
-            "data_science": {
-                "python", "r", "sql", "pandas", "numpy", "scikit-learn",
-                "tensorflow", "pytorch", "jupyter", "matplotlib", "seaborn"
-            },
-            "machine_learning": {
-                "machine learning", "deep learning", "neural networks", "tensorflow",
-                "pytorch", "scikit-learn", "keras", "opencv", "nlp"
-            },
-            "mobile": {
-                "ios", "android", "swift", "kotlin", "react native", "flutter",
-                "xamarin", "cordova", "ionic"
-            }
-        }
-        
-        return categories
+        return SKILL_CATEGORIES
     
     def normalize_skill(self, skill: str) -> str:
         """Normalize skill name for better matching."""
-        # Convert to lowercase and remove special characters
-        normalized = re.sub(r'[^\w\s+#.]', '', skill.lower().strip())
-        
-        # Handle common variations
-        normalized = re.sub(r'\bjs\b', 'javascript', normalized)
-        normalized = re.sub(r'\bml\b', 'machine learning', normalized)
-        normalized = re.sub(r'\bai\b', 'artificial intelligence', normalized)
-        
-        return normalized
+        return _normalize_skill(skill)
     
-    def find_fuzzy_matches(self, skill: str, skill_list: List[str]) -> List[Tuple[str, float]]:
-        """Find fuzzy matches for a skill in a list."""
+    def find_fuzzy_matches(self, skill: str, skill_list: List[str],
+                           top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Find fuzzy matches for a skill in a list, best first.
+        
+        With top_k, only the top_k best matches are returned.
+        """
         matches = []
         normalized_skill = self.normalize_skill(skill)
         
@@ -160,68 +316,140 @@ class SkillMatcher:
             normalized_candidate = self.normalize_skill(candidate)
             
             # Calculate similarity ratio
-            similarity = difflib.SequenceMatcher(None, normalized_skill, normalized_candidate).ratio()
+            similarity = self._fuzzy_similarity(normalized_skill, normalized_candidate)
             
-            if similarity >= self.fuzzy_threshold:
+            if similarity is not None:
                 matches.append((candidate, similarity))
         
+        # Only the best few are needed, so select them without sorting every match
+        if top_k is not None:
+            return heapq.nlargest(top_k, matches, key=itemgetter(1))
+        
         # Sort by similarity descending
-        matches.sort(key=lambda x: x[1], reverse=True)
+        matches.sort(key=itemgetter(1), reverse=True)
         return matches
     
-    def find_synonym_matches(self, skill: str) -> Set[str]:
+    def _fuzzy_similarity(self, normalized_a: str, normalized_b: str) -> Optional[float]:
+        """Similarity ratio of two normalized skills, or None if below the fuzzy threshold."""
+        # RapidFuzz's Indel ratio is based on the longest common subsequence, so it
+        # is never below difflib's ratio; pairs it rules out can skip SequenceMatcher
+        if RAPIDFUZZ_AVAILABLE and self.fuzzy_threshold > 0:
+            if not fuzz.ratio(normalized_a, normalized_b, score_cutoff=self.fuzzy_threshold * 100 - 1e-9):
+                return None
+        
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(),
+        # so a pair either one puts below the threshold can't match
+        matcher = difflib.SequenceMatcher(None, normalized_a, normalized_b)
+        if matcher.real_quick_ratio() < self.fuzzy_threshold or matcher.quick_ratio() < self.fuzzy_threshold:
+            return None
+        
+        similarity = matcher.ratio()
+        return similarity if similarity >= self.fuzzy_threshold else None
+    
+    def _fuzzy_candidate_matrix(self, normalized_user_skills: List[str],
+                                normalized_job_skills: List[str]) -> Optional[List[List[float]]]:
+        """Pre-check every user/job skill pair in one RapidFuzz or numba call.
+        
+        Returns a row per user skill with 0 for pairs below the fuzzy threshold,
+        or None if neither accelerator is available.
+        """
+        if not (self.fuzzy_threshold > 0 and normalized_user_skills and normalized_job_skills):
+            return None
+        
+        if not RAPIDFUZZ_AVAILABLE:
+            if not NUMBA_AVAILABLE:
+                return None
+            return _lcs_ratio_matrix(
+                *_pack_code_points(normalized_user_skills),
+                *_pack_code_points(normalized_job_skills),
+                self.fuzzy_threshold
+            ).tolist()
+        
+        return process.cdist(
+            normalized_user_skills,
+            normalized_job_skills,
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold * 100 - 1e-9
+        ).tolist()
+    
+    def find_synonym_matches(self, skill: str) -> FrozenSet[str]:
         """Find synonym matches for a skill."""
         normalized_skill = self.normalize_skill(skill)
-        return self.skill_synonyms.get(normalized_skill, set())
+        return self.skill_synonyms.get(normalized_skill, frozenset())
     
     def find_category_matches(self, skill: str, job_skills: List[str]) -> List[str]:
         """Find skills in the same category."""
         normalized_skill = self.normalize_skill(skill)
         related_skills = []
         
-        # Find which category the skill belongs to
-        for category, skills in self.skill_categories.items():
-            if normalized_skill in skills:
-                # Find other skills from the same category in job requirements
-                for job_skill in job_skills:
-                    normalized_job_skill = self.normalize_skill(job_skill)
-                    if normalized_job_skill in skills and normalized_job_skill != normalized_skill:
-                        related_skills.append(job_skill)
+        # Find which categories the skill belongs to
+        categories = self._skill_to_categories.get(normalized_skill)
+        if not categories:
+            return related_skills
+        
+        normalized_job_skills = [self.normalize_skill(job_skill) for job_skill in job_skills]
+        for category in categories:
+            skills = self.skill_categories[category]
+            # Find other skills from the same category in job requirements
+            for job_skill, normalized_job_skill in zip(job_skills, normalized_job_skills):
+                if normalized_job_skill in skills and normalized_job_skill != normalized_skill:
+                    related_skills.append(job_skill)
         
         return related_skills
     
     def match_single_skill(self, user_skill: str, job_skills: List[str]) -> List[SkillMatch]:
         """Match a single user skill against job requirements."""
+        return self._match_normalized_skill(
+            user_skill,
+            self.normalize_skill(user_skill),
+            job_skills,
+            [self.normalize_skill(job_skill) for job_skill in job_skills]
+        )
+    
+    def _canonical_forms(self, skill: str, normalized_skill: str) -> FrozenSet[str]:
+        """Every normalized form matching a skill outright: the skill itself and its synonyms."""
+        return self.find_synonym_matches(skill) | {normalized_skill}
+    
+    def _match_normalized_skill(self, user_skill: str, normalized_user_skill: str,
+                                job_skills: List[str], normalized_job_skills: List[str],
+                                fuzzy_candidates: Optional[List[float]] = None) -> List[SkillMatch]:
+        """Match a user skill against job requirements whose normalized forms are already known.
+        
+        fuzzy_candidates optionally holds a pre-check score per job skill; job
+        skills scoring 0 are known to be below the fuzzy threshold.
+        """
         matches = []
-        normalized_user_skill = self.normalize_skill(user_skill)
+        canonical_forms = self._canonical_forms(user_skill, normalized_user_skill)
         
-        for job_skill in job_skills:
-            normalized_job_skill = self.normalize_skill(job_skill)
-            
-            # Exact match
-            if normalized_user_skill == normalized_job_skill:
-                matches.append(SkillMatch(
-                    user_skill=user_skill,
-                    job_skill=job_skill,
-                    match_score=1.0,
-                    match_type="exact"
-                ))
-                continue
-            
-            # Synonym match
-            synonyms = self.find_synonym_matches(user_skill)
-            if normalized_job_skill in synonyms:
-                matches.append(SkillMatch(
-                    user_skill=user_skill,
-                    job_skill=job_skill,
-                    match_score=0.95,
-                    match_type="synonym"
-                ))
+        # An exact match always passes the pre-check, so with no candidate at all
+        # only a synonym could still match
+        if fuzzy_candidates is not None and not any(fuzzy_candidates) and canonical_forms.isdisjoint(normalized_job_skills):
+            return matches
+        
+        for index, (job_skill, normalized_job_skill) in enumerate(zip(job_skills, normalized_job_skills)):
+            # Exact or synonym match, told apart only once one is found
+            if normalized_job_skill in canonical_forms:
+                if normalized_job_skill == normalized_user_skill:
+                    matches.append(SkillMatch(
+                        user_skill=user_skill,
+                        job_skill=job_skill,
+                        match_score=1.0,
+                        match_type="exact"
+                    ))
+                else:
+                    matches.append(SkillMatch(
+                        user_skill=user_skill,
+                        job_skill=job_skill,
+                        match_score=0.95,
+                        match_type="synonym"
+                    ))
                 continue
             
             # Fuzzy match
-            similarity = difflib.SequenceMatcher(None, normalized_user_skill, normalized_job_skill).ratio()
-            if similarity >= self.fuzzy_threshold:
+            if fuzzy_candidates is not None and not fuzzy_candidates[index]:
+                continue
+            similarity = self._fuzzy_similarity(normalized_user_skill, normalized_job_skill)
+            if similarity is not None:
                 matches.append(SkillMatch(
                     user_skill=user_skill,
                     job_skill=job_skill,
@@ -233,39 +461,54 @@ class SkillMatcher:
     
     def analyze_skill_compatibility(self, user_skills: List[str], job_skills: List[str]) -> SkillAnalysis:
         """Perform comprehensive skill compatibility analysis."""
-        all_matches = []
-        matched_job_skills = set()
-        matched_user_skills = set()
+        unique_matches = {}  # Highest scoring match per (user skill, job skill) pair
+        
+        normalized_user_skills = [self.normalize_skill(skill) for skill in user_skills]
+        normalized_job_skills = [self.normalize_skill(skill) for skill in job_skills]
+        fuzzy_candidates = self._fuzzy_candidate_matrix(normalized_user_skills, normalized_job_skills)
+        
+        # Stage normalized skills as small integer ids so the matched sets
+        # become flag masks indexed by id
+        skill_ids = {}
+        user_ids = [skill_ids.setdefault(skill, len(skill_ids)) for skill in normalized_user_skills]
+        job_ids = [skill_ids.setdefault(skill, len(skill_ids)) for skill in normalized_job_skills]
+        job_skill_ids = dict(zip(job_skills, job_ids))
+        matched_job_mask = bytearray(len(skill_ids))
+        matched_user_mask = bytearray(len(skill_ids))
         
         # Find all matches
-        for user_skill in user_skills:
-            skill_matches = self.match_single_skill(user_skill, job_skills)
+        for index, user_skill in enumerate(user_skills):
+            skill_matches = self._match_normalized_skill(
+                user_skill,
+                normalized_user_skills[index],
+                job_skills,
+                normalized_job_skills,
+                fuzzy_candidates[index] if fuzzy_candidates is not None else None
+            )
+            user_id = user_ids[index]
             for match in skill_matches:
-                all_matches.append(match)
-                matched_job_skills.add(self.normalize_skill(match.job_skill))
-                matched_user_skills.add(self.normalize_skill(match.user_skill))
-        
-        # Remove duplicate matches (keep highest scoring)
-        unique_matches = {}
-        for match in all_matches:
-            key = (self.normalize_skill(match.user_skill), self.normalize_skill(match.job_skill))
-            if key not in unique_matches or match.match_score > unique_matches[key].match_score:
-                unique_matches[key] = match
+                job_id = job_skill_ids[match.job_skill]
+                matched_job_mask[job_id] = 1
+                matched_user_mask[user_id] = 1
+                
+                # Remove duplicate matches (keep highest scoring)
+                key = (user_id, job_id)
+                current = unique_matches.get(key)
+                if current is None or match.match_score > current.match_score:
+                    unique_matches[key] = match
         
         final_matches = list(unique_matches.values())
         
         # Calculate missing skills
-        normalized_job_skills = [self.normalize_skill(skill) for skill in job_skills]
         missing_skills = [
-            skill for skill in job_skills 
-            if self.normalize_skill(skill) not in matched_job_skills
+            skill for skill, job_id in zip(job_skills, job_ids)
+            if not matched_job_mask[job_id]
         ]
         
         # Calculate additional skills
-        normalized_user_skills = [self.normalize_skill(skill) for skill in user_skills]
         additional_skills = [
-            skill for skill in user_skills
-            if self.normalize_skill(skill) not in matched_user_skills
+            skill for skill, user_id in zip(user_skills, user_ids)
+            if not matched_user_mask[user_id]
         ]
         
         # Calculate overall match score
@@ -278,7 +521,7 @@ class SkillMatcher:
             overall_score = min(total_weighted_score / max_possible_score, 1.0)
         
         # Calculate coverage percentage
-        coverage = (len(matched_job_skills) / len(job_skills) * 100) if job_skills else 100.0
+        coverage = (matched_job_mask.count(1) / len(job_skills) * 100) if job_skills else 100.0
         
         return SkillAnalysis(
             matched_skills=final_matches,
@@ -22,8 +22,9 @@ class UserProfile:
     
     def __post_init__(self):
         """Validate and clean user profile data."""
-        self.skills = [skill.strip().lower() for skill in self.skills if skill.strip()]
-        self.preferred_roles = [role.strip().lower() for role in self.preferred_roles if role.strip()]
+        # Strip then lowercase in C; lowercasing never empties a string, so blanks can be dropped last
+        self.skills = list(filter(None, map(str.lower, map(str.strip, self.skills))))
+        self.preferred_roles = list(filter(None, map(str.lower, map(str.strip, self.preferred_roles))))
         
         valid_experience_levels = ["entry", "mid", "senior", "executive"]
         if self.experience_level.lower() not in valid_experience_levels:
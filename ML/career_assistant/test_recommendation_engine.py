@@ -0,0 +1,76 @@
+"""
+Tests that the recommendation engine's fast top-k paths rank exactly like a full sort.
+Run with pytest from this directory.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+# Add src to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, 'src')
+sys.path.insert(0, src_path)
+
+from job_scraper import JobPosting
+from recommendation_engine import JobRecommendationEngine, OVERALL_COLUMN, top_k_indices
+from user_profile import create_sample_profile
+
+
+def _stable_top_k(scores, top_k):
+    """Reference ranking: stable descending sort sliced to top_k."""
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    return order[:top_k]
+
+
+def test_top_k_indices_matches_stable_sort():
+    """top_k_indices agrees with a stable descending sort, ties and edge cases included."""
+    rng = random.Random(0)
+    for _ in range(500):
+        n = rng.randint(0, 40)
+        # Few distinct values, so most runs have ties at the k-th score
+        scores = np.array([rng.choice([0.0, 12.5, 50.0, 62.5, 87.5, 100.0]) for _ in range(n)])
+        for top_k in (None, 0, -1, -n - 3, n, n + 5, rng.randint(0, n + 1), rng.randint(1, max(n, 1))):
+            assert top_k_indices(scores, top_k) == _stable_top_k(scores.tolist(), top_k), (scores, top_k)
+
+
+def _random_jobs(rng, count):
+    """Job postings drawing titles, skills and locations from small pools so scores tie."""
+    titles = ["Data Scientist", "Machine Learning Engineer", "Data Analyst",
+              "Backend Developer", "Frontend Developer", "DevOps Engineer"]
+    skills = ["python", "machine learning", "sql", "pandas", "scikit-learn", "java",
+              "react", "docker", "kubernetes", "tensorflow", "aws", "statistics"]
+    locations = ["San Francisco, CA", "New York, NY", "Remote", "Austin, TX"]
+    levels = [None, "entry", "mid", "senior"]
+    salaries = [None, "$70,000 - $90,000", "$100,000 - $140,000", "Not specified"]
+    return [
+        JobPosting(
+            title=rng.choice(titles),
+            company=f"Company {i}",
+            location=rng.choice(locations),
+            description=rng.choice(["Build scalable systems", "Lead innovative AI research",
+                                    "Analyze business data"]),
+            skills_required=rng.sample(skills, rng.randint(0, 5)),
+            experience_level=rng.choice(levels),
+            salary_range=rng.choice(salaries),
+        )
+        for i in range(count)
+    ]
+
+
+def test_score_jobs_pruning_keeps_the_ranking():
+    """Pruned scoring returns the same top k, with the same scores, as scoring every job."""
+    engine = JobRecommendationEngine()
+    profile = create_sample_profile()
+    rng = random.Random(1)
+    for _ in range(20):
+        jobs = _random_jobs(rng, rng.randint(1, 60))
+        full_scores, _ = engine.score_jobs(profile, jobs)
+        for top_k in (1, 3, 5, len(jobs) - 1, len(jobs)):
+            pruned_scores, skill_analyses = engine.score_jobs(profile, jobs, top_k)
+            expected = top_k_indices(full_scores[:, OVERALL_COLUMN], top_k)
+            assert top_k_indices(pruned_scores[:, OVERALL_COLUMN], top_k) == expected
+            assert pruned_scores[expected].tolist() == full_scores[expected].tolist()
+            assert all(skill_analyses[i] is not None for i in expected)
@@ -1,12 +1,36 @@
+import io
 import os
 import re
 import json
+import calendar
+import hashlib
 import platform
+import shutil
+import threading
+from collections import OrderedDict
 from flask import Flask, request, jsonify, send_from_directory
-from PIL import Image
+from PIL import Image, ImageOps
+
+# Keep Tesseract single-threaded: OpenMP threads contend badly across
+# concurrent requests, so scale with more worker processes instead
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
 import pytesseract
 from datetime import datetime
 
+# Optional fast JSON decoder for the extraction rules
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional persistent Tesseract API, avoiding a process spawn and model load per request
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 app = Flask(__name__)
 
 # Configure Tesseract path based on environment
@@ -18,6 +42,13 @@ def configure_tesseract():
         print(f"Using Tesseract from environment: {tesseract_cmd}")
         return
     
+    # Fast path: a stat per PATH entry instead of spawning Tesseract to probe for it
+    tesseract_cmd = shutil.which('tesseract')
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        print(f"Found Tesseract in PATH: {tesseract_cmd}")
+        return
+    
     # Auto-detect common installation paths
     import platform
     system = platform.system().lower()
@@ -57,45 +88,183 @@ def configure_tesseract():
                 print(f"Found Tesseract at: {path}")
                 return
     
-    # If nothing found, try PATH lookup
-    try:
-        # Test if tesseract is available in PATH
-        result = pytesseract.image_to_string(Image.new('RGB', (1, 1), color='white'))
-        print("Tesseract found in PATH")
-    except Exception as e:
-        print(f"Warning: Tesseract not found. Error: {e}")
-        print("Please install tesseract and ensure it's in your PATH, or set TESSERACT_CMD environment variable")
+    print("Warning: Tesseract not found.")
+    print("Please install tesseract and ensure it's in your PATH, or set TESSERACT_CMD environment variable")
 
 # Configure Tesseract on startup
 configure_tesseract()
 
 # Load extraction rules
-with open('extraction_rules.json', 'r', encoding='utf-8') as f:
-    extraction_rules = json.load(f)
+with open('extraction_rules.json', 'rb') as f:
+    extraction_rules = json_loads(f.read())
+
+# Keywords identifying a platform in OCR text, in detection order: the rule
+# names, then OCR misreadings of the Udemy logo not already covered by them
+UDEMY_OCR_ALIASES = ('udemy', 'vaemy', '#beable')
+PLATFORM_KEYWORDS = tuple((key, key) for key in extraction_rules) + tuple(
+    (alias, 'udemy') for alias in UDEMY_OCR_ALIASES if alias not in extraction_rules
+)
+
+# Issuer shown for platforms whose display name differs from their rule key
+PLATFORM_DISPLAY_NAMES = {
+    'coursera': 'Coursera',
+    'nptel': 'NPTEL Online Certification',
+    'upgrad': 'upGrad',
+}
+
+# Anchor lines each platform's fields are read around: field -> keywords
+# that must all appear in the (lowercased) line
+PLATFORM_ANCHORS = {
+    'coursera': {'completed': ('has', 'completed')},  # 'has sccesflly completed', OCR typo tolerant
+    'nptel': {'name': ('certificate is awarded to',), 'title': ('completing the course',)},
+    'simplilearn': {'name': ('congratulations',), 'title': ('successfully completed our training program on',)},
+    'udemy': {'name': ('this is to certify that',), 'title': ('hours of',), 'date': ('online course on',)},
+    'upgrad': {
+        'name': ('this is to certify that',),
+        'title': ('successfully completed the course on',),
+        'date': ('issued on',),
+    },
+}
+
+# Patterns compiled once per process instead of on every request
+NPTEL_DATE_RE = re.compile(r'([A-Za-z]{3})-([A-Za-z]{3}) (\d{4})')
+SIMPL_DATE_RE = re.compile(r'(\d{1,2})["\s]*([A-Za-z]{3}) (\d{4})')
+UPGRAD_DATE_RE = re.compile(r'(\d{2})-(\d{2})-(\d{4})')
+UDEMY_DATE_RE = re.compile(r'on\s*([A-Za-z]{3,}\.\s*\d{1,2},\s*\d{4})')
+UDEMY_NAME_RE = re.compile(r'this is to certify that\s*(.*)')
+YEAR_RE = re.compile(r'(\d{4})')
+
+# Month abbreviation (lowercase) -> month number
+MONTH_ABBR_TO_NUM = {abbr.lower(): num for num, abbr in enumerate(calendar.month_abbr) if abbr}
+
+# OCR preprocessing: larger uploads are downscaled to roughly 300 DPI for an
+# A4 certificate, and pixels brighter than the threshold become white
+OCR_MAX_DIMENSION = 2000
+OCR_BINARIZE_THRESHOLD = 180
+OCR_BINARIZE_TABLE = [255 if p > OCR_BINARIZE_THRESHOLD else 0 for p in range(256)]
+
+# Certificates are English single blocks of text: the LSTM engine alone with
+# uniform-block segmentation skips the legacy engine and layout analysis
+TESSERACT_LANG = 'eng'
+TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+# Created on first use in each worker process; the API is not thread-safe
+_tess_api = None
+_tess_api_lock = threading.Lock()
+
+# OCR text of recent uploads by content digest, so retried or repeated
+# uploads skip OCR; least recently used entries are evicted first
+OCR_CACHE_SIZE = 1024
+_ocr_cache = OrderedDict()
+_ocr_cache_lock = threading.Lock()
 
 # Helper functions for extraction
 
+def ocr_image(img):
+    """Extract text from an image, through the persistent Tesseract API when tesserocr is installed."""
+    global _tess_api
+    if not TESSEROCR_AVAILABLE:
+        return pytesseract.image_to_string(img, lang=TESSERACT_LANG, config=TESSERACT_CONFIG)
+    with _tess_api_lock:
+        if _tess_api is None:
+            _tess_api = PyTessBaseAPI(lang=TESSERACT_LANG, psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+        _tess_api.SetImage(img)
+        return _tess_api.GetUTF8Text()
+
+def ocr_upload(raw_bytes):
+    """Extract text from uploaded image bytes, reusing the text of an identical earlier upload."""
+    digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+    with _ocr_cache_lock:
+        text = _ocr_cache.get(digest)
+        if text is not None:
+            _ocr_cache.move_to_end(digest)
+            return text
+    
+    img = Image.open(io.BytesIO(raw_bytes))
+    img.load()
+    text = ocr_image(preprocess_for_ocr(img))
+    
+    with _ocr_cache_lock:
+        _ocr_cache[digest] = text
+        if len(_ocr_cache) > OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+    return text
+
+def preprocess_for_ocr(img):
+    """Grayscale, downscale and binarize an image so Tesseract has fewer pixels to recognize."""
+    img = img.convert('L')
+    if max(img.size) > OCR_MAX_DIMENSION:
+        img.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.LANCZOS)
+    img = ImageOps.autocontrast(img)
+    return img.point(OCR_BINARIZE_TABLE, mode='1')
+
+# Common date formats, grouped by the shape of the strings they can parse.
+# A month name means letters, and numeric formats need their separator.
+DATE_FORMATS_BY_SHAPE = {
+    ('numeric', '-'): ('%d-%m-%Y',),
+    ('numeric', '/'): ('%d/%m/%Y',),
+    ('named', ' '): ('%d %b %Y', '%d %B %Y', '%dth %B %Y'),
+    ('named', ','): ('%d %B, %Y', '%d %b, %Y'),
+    ('named', '.'): ('%b. %d, %Y',),
+}
+
+def date_shape(date_str):
+    """Cheap fingerprint of a date string selecting the formats worth trying."""
+    if any(c.isalpha() for c in date_str):
+        if '.' in date_str:
+            return ('named', '.')
+        return ('named', ',' if ',' in date_str else ' ')
+    has_dash = '-' in date_str
+    if has_dash == ('/' in date_str):
+        return None  # Neither or both separators, so no numeric format fits
+    return ('numeric', '-' if has_dash else '/')
+
+def reformat_numeric_date(date_str):
+    """dd-mm-yyyy or dd/mm/yyyy as dd/mm/yy by slicing, or None for any other string or an invalid date."""
+    if len(date_str) != 10 or not date_str.isascii():
+        return None
+    day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+    separator = date_str[2]
+    if separator not in '-/' or date_str[5] != separator:
+        return None
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+    try:
+        datetime(int(year), int(month), int(day))  # Same calendar checks as strptime
+    except ValueError:
+        return None
+    return f"{day}/{month}/{year[2:]}"
+
 def format_date(date_str):
     if not date_str:
         return ''
-    # Try common formats
-    for fmt in [
-        '%d-%m-%Y', '%d/%m/%Y', '%d %b %Y', '%d %B %Y', '%b-%b %Y', '%b. %d, %Y', '%dth %B %Y', '%d %B, %Y', '%d %b, %Y'
-    ]:
+    # Common numeric dates only need their fields reordered
+    reformatted = reformat_numeric_date(date_str)
+    if reformatted:
+        return reformatted
+    # Try only the common formats matching the string's shape
+    for fmt in DATE_FORMATS_BY_SHAPE.get(date_shape(date_str), ()):
         try:
             # Convert to dd/mm/yy format for UI
             return datetime.strptime(date_str, fmt).strftime('%d/%m/%y')
         except Exception:
             continue
     # Try extracting year if nothing else
-    year_match = re.search(r'(\d{4})', date_str)
+    year_match = YEAR_RE.search(date_str)
     if year_match:
         return year_match.group(1)
     return date_str
 
+def find_anchor(lines_lower, keywords):
+    """Index of the first line containing every keyword, or None."""
+    if len(keywords) == 1:
+        keyword = keywords[0]
+        return next((i for i, line in enumerate(lines_lower) if keyword in line), None)
+    return next((i for i, line in enumerate(lines_lower) if all(k in line for k in keywords)), None)
+
 def extract_info(text, platform_hint=None):
-    text_lower = text.lower()
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    lines = list(filter(None, map(str.strip, text.splitlines())))  # Stripped once, blanks dropped
+    lines_lower = list(map(str.lower, lines))  # Lowercased once for every keyword scan
     platform = None
     
     # If platform hint is provided, try to use it first
@@ -107,134 +276,118 @@ def extract_info(text, platform_hint=None):
         elif platform_hint_lower == 'coursera' and 'coursera' in extraction_rules:
             platform = 'coursera'
     
-    # If no platform from hint, try extraction_rules keys in text
+    # If no platform from hint, look for the platform keywords in the text
     if not platform:
-        for key in extraction_rules:
-            if key in text_lower:
-                platform = key
-                break
-    
-    # If not found, check for Udemy OCR errors
-    if not platform:
-        if 'udemy' in text_lower or 'vaemy' in text_lower or '#beable' in text_lower:
-            platform = 'udemy'
-        else:
+        text_lower = text.lower()
+        platform = next((name for keyword, name in PLATFORM_KEYWORDS if keyword in text_lower), None)
+        if not platform:
             return {'issuer': 'Unknown', 'name': '', 'title': '', 'issueDate': ''}
     rule = extraction_rules.get(platform, {})
+    anchors = {
+        field: find_anchor(lines_lower, keywords)
+        for field, keywords in PLATFORM_ANCHORS.get(platform, {}).items()
+    }
     name = ''
     title = ''  # course will be mapped to title
     issueDate = ''  # date will be mapped to issueDate
     if platform == 'coursera':
         # Find the line containing 'has sccesflly completed' (OCR typo tolerant)
-        idx = next((i for i, l in enumerate(lines) if 'has' in l.lower() and 'completed' in l.lower()), None)
+        idx = anchors['completed']
         if idx is not None:
             # Name is the line before
             name = lines[idx-1] if idx > 0 else ''
             # Course is the line after
             title = lines[idx+1] if idx+1 < len(lines) else ''
-        # Platform is always 'Coursera'
-        platform = 'Coursera'
         issueDate = ''  # No date in Coursera sample
     elif platform == 'nptel':
         # Find the line containing 'This certificate is awarded to'
-        idx = next((i for i, l in enumerate(lines) if 'certificate is awarded to' in l.lower()), None)
+        idx = anchors['name']
         if idx is not None and idx+1 < len(lines):
             name = lines[idx+1]
         # Find the line containing 'for successfully completing the course'
-        idx2 = next((i for i, l in enumerate(lines) if 'completing the course' in l.lower()), None)
+        idx2 = anchors['title']
         if idx2 is not None and idx2+1 < len(lines):
             title = lines[idx2+1]
         # Find the line containing the date pattern (e.g., Jan-Apr 2019)
-        date_line = next((l for l in lines if re.search(r'[A-Za-z]{3}-[A-Za-z]{3} \d{4}', l)), '')
-        date_match = re.search(r'([A-Za-z]{3})-([A-Za-z]{3}) (\d{4})', date_line)
+        date_line = next((l for l in lines if NPTEL_DATE_RE.search(l)), '')
+        date_match = NPTEL_DATE_RE.search(date_line)
         if date_match:
             # Use second month and year, day is null
             month_str = date_match.group(2)
             year_str = date_match.group(3)
             # Convert month abbreviation to number
-            import calendar
-            try:
-                month_num = list(calendar.month_abbr).index(month_str[:3].title())
-            except Exception:
-                month_num = None
+            month_num = MONTH_ABBR_TO_NUM.get(month_str[:3].lower())
             if month_num:
                 issueDate = f"null/{month_num:02d}/{str(year_str)[-2:]}"
             else:
                 issueDate = f"null/{month_str}/{str(year_str)[-2:]}"
-        platform = 'NPTEL Online Certification'
     elif platform == 'simplilearn':
         # Find the line after 'Congratulations!'
-        idx = next((i for i, l in enumerate(lines) if 'congratulations' in l.lower()), None)
+        idx = anchors['name']
         if idx is not None and idx+1 < len(lines):
             name = lines[idx+1]
         # Find the line containing 'successfully completed our training program on'
-        idx2 = next((i for i, l in enumerate(lines) if 'successfully completed our training program on' in l.lower()), None)
+        idx2 = anchors['title']
         if idx2 is not None and idx2+1 < len(lines):
             title = lines[idx2+1]
         # Find the line containing the date (e.g., 08" Nov 2019)
-        date_line = next((l for l in lines if re.search(r'\d{1,2}["\s]*[A-Za-z]{3} \d{4}', l)), '')
-        date_match = re.search(r'(\d{1,2})["\s]*([A-Za-z]{3}) (\d{4})', date_line)
+        date_line = next((l for l in lines if SIMPL_DATE_RE.search(l)), '')
+        date_match = SIMPL_DATE_RE.search(date_line)
         if date_match:
             day = date_match.group(1)
             month_str = date_match.group(2)
             year_str = date_match.group(3)
-            import calendar
-            try:
-                month_num = list(calendar.month_abbr).index(month_str[:3].title())
-            except Exception:
-                month_num = None
+            month_num = MONTH_ABBR_TO_NUM.get(month_str[:3].lower())
             if month_num:
                 issueDate = f"{int(day):02d}/{month_num:02d}/{str(year_str)[-2:]}"
             else:
                 issueDate = f"{int(day):02d}/{month_str}/{str(year_str)[-2:]}"
-        platform = 'simplilearn'
     elif platform == 'udemy':
         # Find the line containing 'This is to certify that' and extract name
-        idx = next((i for i, l in enumerate(lines) if 'this is to certify that' in l.lower()), None)
+        idx = anchors['name']
         if idx is not None and idx+1 < len(lines):
             name_line = lines[idx+1]
-            name_match = re.search(r'this is to certify that\s*(.*)', lines[idx].lower())
+            name_match = UDEMY_NAME_RE.search(lines_lower[idx])
             if name_match:
                 name = name_match.group(1).strip()
             else:
-                name = name_line.strip()
+                name = name_line
         # Find the line containing 'successfully completed' and extract course
-        idx2 = next((i for i, l in enumerate(lines) if 'hours of' in l.lower()), None)
+        idx2 = anchors['title']
         if idx2 is not None:
             # Collect all lines after 'hours of' up to 'online course', including multi-line course names
             course_lines = []
             for i in range(idx2+1, len(lines)):
-                if 'online course' in lines[i].lower():
+                if 'online course' in lines_lower[i]:
                     break
-                course_lines.append(lines[i].strip())
+                course_lines.append(lines[i])
             # Join lines with a space to form the full course name
             title = ' '.join(course_lines).replace('course :', '').strip()
         # Find the line containing 'online course on' and extract date
-        date_line = next((l for l in lines if 'online course on' in l.lower()), '')
-        date_match = re.search(r'on\s*([A-Za-z]{3,}\.\s*\d{1,2},\s*\d{4})', date_line)
+        idx3 = anchors['date']
+        date_line = lines[idx3] if idx3 is not None else ''
+        date_match = UDEMY_DATE_RE.search(date_line)
         if date_match:
             issueDate = date_match.group(1)
-        platform = 'udemy'
     elif platform == 'upgrad':
         # Find the line after 'This is to certify that'
-        idx = next((i for i, l in enumerate(lines) if 'this is to certify that' in l.lower()), None)
+        idx = anchors['name']
         if idx is not None and idx+1 < len(lines):
             name = lines[idx+1]
         # Find the line after 'has successfully completed the course on'
-        idx2 = next((i for i, l in enumerate(lines) if 'successfully completed the course on' in l.lower()), None)
+        idx2 = anchors['title']
         if idx2 is not None and idx2+1 < len(lines):
             title = lines[idx2+1]
         # Find the line after 'Issued on:' for date
-        idx3 = next((i for i, l in enumerate(lines) if 'issued on' in l.lower()), None)
+        idx3 = anchors['date']
         if idx3 is not None and idx3+1 < len(lines):
             date_line = lines[idx3+1]
-            date_match = re.search(r'(\d{2})-(\d{2})-(\d{4})', date_line)
+            date_match = UPGRAD_DATE_RE.search(date_line)
             if date_match:
                 day = date_match.group(1)
                 month = date_match.group(2)
                 year = date_match.group(3)[-2:]
                 issueDate = f"{day}/{month}/{year}"
-        platform = 'upGrad'
     if issueDate:
         issueDate = format_date(issueDate)
     
@@ -243,7 +396,7 @@ def extract_info(text, platform_hint=None):
         issueDate = issueDate.replace('null/', '01/')  # Default to 1st day of month
     
     return {
-        'issuer': platform, 
+        'issuer': PLATFORM_DISPLAY_NAMES.get(platform, platform),
         'name': name, 
         'title': title, 
         'issueDate': issueDate,
@@ -264,8 +417,9 @@ def extract():
     platform_hint = request.form.get('platform', None)
     
     try:
-        img = Image.open(file.stream)
-        text = pytesseract.image_to_string(img)
+        # Read the upload once into memory rather than letting PIL pull blocks
+        # from the possibly disk-spooled stream
+        text = ocr_upload(file.read())
         info = extract_info(text, platform_hint)
         
         return jsonify({
@@ -292,9 +446,10 @@ def serve_html():
     return send_from_directory('.', 'cert_extractor.html')
 
 if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see gunicorn_conf.py)
     # Get configuration from environment variables
     port = int(os.environ.get('PORT', 5000))
-    debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
+    debug = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
     
     print(f"Starting Certificate Extraction Service on port {port}")
     print(f"Debug mode: {debug}")
@@ -1,6 +1,11 @@
+import os
+
+# Single-threaded Tesseract per process; the certificates are OCR'd in parallel instead
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 import pytesseract
 from PIL import Image
-import os
+from multiprocessing import Pool
 
 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
@@ -12,18 +17,29 @@ cert_files = [
     'upgrad.webp'
 ]
 
-with open('all_cert_texts.txt', 'w', encoding='utf-8') as f:
-    for cert in cert_files:
-        if os.path.exists(cert):
-            try:
-                img = Image.open(cert)
-                text = pytesseract.image_to_string(img)
+def _ocr_one(cert):
+    """OCR one certificate, returning (cert, text, error message); text is None if the file is missing."""
+    if not os.path.exists(cert):
+        return cert, None, None
+    try:
+        img = Image.open(cert)
+        return cert, pytesseract.image_to_string(img, lang='eng', config='--oem 1 --psm 6'), None
+    except Exception as e:
+        return cert, None, str(e)
+
+if __name__ == '__main__':
+    with Pool(processes=min(len(cert_files), os.cpu_count() or 1)) as pool:
+        results = pool.map(_ocr_one, cert_files)
+
+    with open('all_cert_texts.txt', 'w', encoding='utf-8') as f:
+        for cert, text, error in results:
+            if error is not None:
+                f.write(f"--- {cert} ---\nError: {error}\n\n")
+                print(f"Error reading {cert}: {error}")
+            elif text is None:
+                f.write(f"--- {cert} ---\nFile not found\n\n")
+                print(f"File not found: {cert}")
+            else:
                 f.write(f"--- {cert} ---\n{text}\n\n")
                 print(f"Extracted text from {cert}")
-            except Exception as e:
-                f.write(f"--- {cert} ---\nError: {e}\n\n")
-                print(f"Error reading {cert}: {e}")
-        else:
-            f.write(f"--- {cert} ---\nFile not found\n\n")
-            print(f"File not found: {cert}")
-print("\n✅ All certificate texts saved to all_cert_texts.txt")
\ No newline at end of file
+    print("\n✅ All certificate texts saved to all_cert_texts.txt")
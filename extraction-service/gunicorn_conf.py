@@ -0,0 +1,24 @@
+import os
+
+# Gunicorn settings for the extraction service:
+#   gunicorn -c gunicorn_conf.py cert_extractor_api:app
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# OCR is CPU-bound and Tesseract runs single-threaded, so scale with
+# single-threaded worker processes rather than threads, one per usable CPU
+# (the container's CPU set, not the host's core count, where the OS reports it)
+if hasattr(os, 'sched_getaffinity'):
+    _usable_cpus = len(os.sched_getaffinity(0))
+else:
+    _usable_cpus = os.cpu_count() or 1
+workers = int(os.environ.get('WEB_CONCURRENCY', _usable_cpus))
+worker_class = 'sync'
+threads = 1
+
+# OCR of a large upload can take several seconds
+timeout = 120
+
+# Load the app (Tesseract lookup, extraction rules) once in the master so
+# workers share it copy-on-write; the tesserocr API is still created per worker
+preload_app = True